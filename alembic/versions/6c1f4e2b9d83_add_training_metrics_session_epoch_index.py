@@ -0,0 +1,31 @@
+"""add training_metrics session/epoch index
+
+Revision ID: 6c1f4e2b9d83
+Revises: 21a0bd731f7d
+Create Date: 2026-10-15 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1f4e2b9d83'
+down_revision: Union[str, None] = '21a0bd731f7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_training_metrics_session_epoch',
+        'training_metrics',
+        ['session_id', 'epoch'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_training_metrics_session_epoch', table_name='training_metrics')
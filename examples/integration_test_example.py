@@ -3,8 +3,10 @@ Tiny integration-test snippets for the training API.
 Run: python examples/integration_test_example.py
 """
 
+import asyncio
 import time
-from fastapi.testclient import TestClient
+import httpx
+import orjson
 from pathlib import Path
 import sys
 
@@ -14,69 +16,122 @@ sys.path.insert(0, str(project_root))
 from main import app
 
 
-client = TestClient(app)
-
 DATASETS = {
     "iris": {
         "dataset_id": "iris",
-        "layers": [{"neurons": 4, "activation": "relu"}, {"neurons": 3, "activation": "softmax"}],
+        "layers": [
+            {"type": "input", "neurons": 4, "position": 0},
+            {"type": "output", "neurons": 3, "activation": "softmax", "position": 1},
+        ],
         "hyperparameters": {"epochs": 3, "learning_rate": 0.01, "batch_size": 16, "optimizer": "adam"},
     },
     "iris_deep": {
         "dataset_id": "iris",
         "layers": [
-            {"neurons": 4, "activation": "relu"},
-            {"neurons": 8, "activation": "relu"},
-            {"neurons": 3, "activation": "softmax"},
+            {"type": "input", "neurons": 4, "position": 0},
+            {"type": "hidden", "neurons": 8, "activation": "relu", "position": 1},
+            {"type": "output", "neurons": 3, "activation": "softmax", "position": 2},
         ],
         "hyperparameters": {"epochs": 5, "learning_rate": 0.01, "batch_size": 16, "optimizer": "adam"},
     },
     "synthetic": {
         "dataset_id": "synthetic",
-        "layers": [{"neurons": 2, "activation": "relu"}, {"neurons": 2, "activation": "softmax"}],
+        "layers": [
+            {"type": "input", "neurons": 2, "position": 0},
+            {"type": "output", "neurons": 2, "activation": "softmax", "position": 1},
+        ],
         "hyperparameters": {"epochs": 5, "learning_rate": 0.01, "batch_size": 32, "optimizer": "adam"},
     },
 }
 
-
-def wait_for_training_completion(model_id: str, max_wait_time: int = 90):
-    """Poll /status until training completes or times out."""
-    start_time = time.time()
-    while time.time() - start_time < max_wait_time:
-        response = client.get(f"/api/models/{model_id}/status")
+TERMINAL_STATUSES = {"completed", "failed", "stopped"}
+LONG_POLL_SECONDS = 20
+# Retry delay after a failed poll: start small, grow 1.5x, cap at 5s
+RETRY_INITIAL_SECONDS = 0.1
+RETRY_MAX_SECONDS = 5.0
+# The server runs at most two training jobs at once and answers further
+# starts with 429; the semaphore avoids most of those, start_training retries the rest
+MAX_CONCURRENT_TRAINING = 2
+# How long start_training keeps retrying 429 responses before giving up
+START_RETRY_SECONDS = 60
+
+
+def async_client() -> httpx.AsyncClient:
+    """Async client bound to the in-process app (no server needed).
+
+    ASGITransport calls the app directly on the running loop, so one client
+    is shared by every example instead of paying TestClient's per-request
+    thread hop.
+    """
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+async def wait_for_training_completion(client: httpx.AsyncClient, session_id: str, max_wait_time: int = 90):
+    """Long-poll /status until training completes or times out.
+
+    The server holds each request open until the status changes (or
+    LONG_POLL_SECONDS pass), so the loop reconnects immediately instead of
+    sleeping between polls.
+    """
+    deadline = time.monotonic() + max_wait_time
+    last_status = None
+    retry_delay = RETRY_INITIAL_SECONDS
+    while time.monotonic() < deadline:
+        params = {"wait": LONG_POLL_SECONDS}
+        if last_status is not None:
+            params["since_status"] = last_status
+        response = await client.get(f"/api/training/{session_id}/status", params=params)
+        if response.status_code >= 500:
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 1.5, RETRY_MAX_SECONDS)
+            continue
+        retry_delay = RETRY_INITIAL_SECONDS
         if response.status_code != 200:
             raise RuntimeError(f"status lookup failed: {response.status_code}")
-        status_data = response.json()
-        if status_data.get("status") in {"completed", "failed", "cancelled"}:
+        status_data = orjson.loads(response.content)
+        last_status = status_data.get("status")
+        if last_status in TERMINAL_STATUSES:
             return status_data
-        time.sleep(1.0)
     raise TimeoutError(f"training exceeded {max_wait_time}s")
 
 
-def create_and_train(config_name: str, wait: int = 60):
+async def start_training(client: httpx.AsyncClient, model_id: str, payload: dict) -> httpx.Response:
+    """POST /train, backing off while every training worker is busy (429)."""
+    deadline = time.monotonic() + START_RETRY_SECONDS
+    retry_delay = RETRY_INITIAL_SECONDS
+    while True:
+        response = await client.post(f"/api/models/{model_id}/train", json=payload)
+        if response.status_code != 429 or time.monotonic() >= deadline:
+            return response
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 1.5, RETRY_MAX_SECONDS)
+
+
+async def create_and_train(client: httpx.AsyncClient, config_name: str, wait: int = 60):
     """Create, trigger training, and wait; returns (model_id, status_dict)."""
     config = DATASETS[config_name]
-    create = client.post("/api/models", json=config)
+    create = await client.post("/api/models", json=config)
     if create.status_code != 201:
         raise RuntimeError(f"{config_name}: create failed ({create.status_code})")
     model_id = create.json()["id"]
-    train = client.post(f"/api/models/{model_id}/train")
+    train = await start_training(client, model_id, config["hyperparameters"])
     if train.status_code != 202:
         raise RuntimeError(f"{config_name}: train failed ({train.status_code})")
-    return model_id, wait_for_training_completion(model_id, wait)
+    session_id = train.json()["session_id"]
+    return model_id, await wait_for_training_completion(client, session_id, wait)
 
 
-def example_basic():
+async def example_basic(client: httpx.AsyncClient):
     """Example 1: single happy-path run."""
     try:
         start = time.time()
-        _, status = create_and_train("iris_deep", wait=60)
+        _, status = await create_and_train(client, "iris_deep", wait=60)
         print(f"[basic] {status['status']} in {time.time() - start:.1f}s metrics={status.get('metrics', {})}")
     except Exception as exc:
         print(f"[basic] {exc}")
 
 
-def example_errors():
+async def example_errors(client: httpx.AsyncClient):
     """Example 2: three quick negative tests."""
     tests = [
         ("missing layers", {"dataset_id": "iris", "hyperparameters": {"epochs": 1}}, 400),
@@ -85,58 +140,76 @@ def example_errors():
     ]
     for label, payload, expected in tests:
         if payload is None:
-            resp = client.get("/api/models/does_not_exist")
+            resp = await client.get("/api/models/does_not_exist")
         else:
-            resp = client.post("/api/models", json=payload)
+            resp = await client.post("/api/models", json=payload)
         outcome = "✅" if resp.status_code == expected else f"❌ got {resp.status_code}"
         print(f"[error] {label}: expect {expected} -> {outcome}")
 
 
-def example_multi_dataset():
-    """Example 3: run iris + synthetic sequentially."""
-    for name in ("iris", "synthetic"):
-        try:
-            _, status = create_and_train(name, wait=90)
-            print(f"[multi:{name}] {status['status']} metrics={status.get('metrics', {})}")
-        except Exception as exc:
-            print(f"[multi:{name}] {exc}")
+async def example_multi_dataset(client: httpx.AsyncClient):
+    """Example 3: run iris + synthetic concurrently."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRAINING)
+
+    async def run_one(name: str):
+        async with semaphore:
+            try:
+                _, status = await create_and_train(client, name, wait=90)
+                print(f"[multi:{name}] {status['status']} metrics={status.get('metrics', {})}")
+            except Exception as exc:
+                print(f"[multi:{name}] {exc}")
 
+    start = time.time()
+    await asyncio.gather(*(run_one(name) for name in ("iris", "synthetic")))
+    print(f"[multi] done in {time.time() - start:.1f}s")
 
-def example_polling():
-    """Example 4: manual poll loop showing progress."""
-    create = client.post("/api/models", json=DATASETS["iris"])
+
+async def example_polling(client: httpx.AsyncClient):
+    """Example 4: long-poll loop showing progress as each epoch lands."""
+    create = await client.post("/api/models", json=DATASETS["iris"])
     if create.status_code != 201:
         print("[poll] create failed")
         return
     model_id = create.json()["id"]
-    if client.post(f"/api/models/{model_id}/train").status_code != 202:
+    train = await start_training(client, model_id, DATASETS["iris"]["hyperparameters"])
+    if train.status_code != 202:
         print("[poll] train failed")
         return
+    session_id = train.json()["session_id"]
 
+    since_epoch, last_status = 0, None
+    retry_delay = RETRY_INITIAL_SECONDS
     for poll in range(60):
-        resp = client.get(f"/api/models/{model_id}/status")
+        params = {"wait": LONG_POLL_SECONDS, "since_epoch": since_epoch}
+        if last_status is not None:
+            params["since_status"] = last_status
+        resp = await client.get(f"/api/training/{session_id}/status", params=params)
+        if resp.status_code >= 500:
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 1.5, RETRY_MAX_SECONDS)
+            continue
+        retry_delay = RETRY_INITIAL_SECONDS
         if resp.status_code != 200:
             print(f"[poll] status failed ({resp.status_code})")
             break
-        status = resp.json()
-        epoch = status.get("current_epoch")
-        total = status.get("total_epochs", "?")
-        msg = f"epoch {epoch}/{total}" if epoch is not None else "no epoch info"
-        print(f"[poll] {status.get('status')} ({msg})")
-        if status.get("status") in {"completed", "failed", "cancelled"}:
+        status = orjson.loads(resp.content)
+        last_status = status.get("status")
+        if status["metrics"]:
+            since_epoch = status["metrics"][-1]["epoch"]
+        print(f"[poll] {last_status} (epoch {status['current_epoch']}/{status['total_epochs']})")
+        if last_status in TERMINAL_STATUSES:
             print(f"[poll] final metrics: {status.get('metrics')}")
             break
-        time.sleep(1.0)
     else:
         print("[poll] timeout")
 
 
-def main():
+async def main():
     print("Integration test snippets\n")
-    for func in (example_basic, example_errors, example_multi_dataset, example_polling):
-        func()
+    async with async_client() as client:
+        for func in (example_basic, example_errors, example_multi_dataset, example_polling):
+            await func(client)
 
 
 if __name__ == "__main__":
-    main()
-
+    asyncio.run(main())
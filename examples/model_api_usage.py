@@ -13,10 +13,18 @@ from typing import Any, Dict
 
 import httpx
 
-API_ROOT = "http://localhost:8000/api/models"
+API_ROOT = "http://localhost:8000"
+MODELS_PATH = "/api/models"
 
+# One shared client so every call reuses the same keep-alive connection
+_CLIENT = httpx.Client(
+    base_url=API_ROOT,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+)
 
-def create_model(client: httpx.Client) -> Dict[str, Any]:
+
+def create_model() -> Dict[str, Any]:
     """Send a POST request to create a model."""
     payload = {
         "name": "Example MNIST Model",
@@ -28,25 +36,25 @@ def create_model(client: httpx.Client) -> Dict[str, Any]:
             {"type": "output", "neurons": 10, "activation": "softmax", "position": 2},
         ],
     }
-    response = client.post(API_ROOT, json=payload)
+    response = _CLIENT.post(MODELS_PATH, json=payload)
     response.raise_for_status()
     return response.json()
 
 
-def get_model(client: httpx.Client, model_id: str) -> Dict[str, Any]:
+def get_model(model_id: str) -> Dict[str, Any]:
     """Fetch a model by id."""
-    response = client.get(f"{API_ROOT}/{model_id}")
+    response = _CLIENT.get(f"{MODELS_PATH}/{model_id}")
     response.raise_for_status()
     return response.json()
 
 
 def main() -> None:
-    with httpx.Client(timeout=10.0) as client:
-        created = create_model(client)
+    with _CLIENT:
+        created = create_model()
         print("Created model:")
         print(created)
 
-        fetched = get_model(client, created["id"])
+        fetched = get_model(created["id"])
         print("\nFetched model:")
         print(fetched)
 
@@ -6,22 +6,9 @@ Run with:
 """
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
-from backend.api.templates import TEMPLATES
-
-
-def _layer_shapes(template: dict) -> List[Tuple[int, int]]:
-    """Return (in_features, out_features) per Linear layer implied by template."""
-    layers = template["layers"]
-    shapes: List[Tuple[int, int]] = []
-    prev = None
-    for layer in layers:
-        neurons = int(layer["neurons"])
-        if prev is not None:
-            shapes.append((prev, neurons))
-        prev = neurons
-    return shapes
+from backend.api.templates import TEMPLATE_SHAPES, TEMPLATES
 
 
 def main() -> None:
@@ -32,8 +19,7 @@ def main() -> None:
     for dataset_id, templates in sorted(by_dataset.items()):
         print(f"Dataset: {dataset_id}")
         for tpl in sorted(templates, key=lambda t: t["id"]):
-            shapes = _layer_shapes(tpl)
-            shape_str = " → ".join(f"{i}->{o}" for i, o in shapes)
+            shape_str = " → ".join(f"{i}->{o}" for i, o in TEMPLATE_SHAPES[tpl["id"]])
             print(f"  {tpl['id']}: {shape_str}")
 
 
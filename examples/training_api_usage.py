@@ -1,34 +1,30 @@
 """Minimal end-to-end example for the training API.
 
 Run FastAPI first (`uvicorn src.main:app --reload`), then execute this script to:
-1. Register a throwaway model definition (using the backend helper).
-2. Start training via `POST /api/models/{id}/train`.
-3. Poll `GET /api/training/{session_id}/status` until completion.
+1. Start training a seeded template model via `POST /api/models/{id}/train`.
+2. Follow `GET /api/training/{session_id}/stream` (server-sent events) until
+   the session reaches a terminal status.
+
+`GET /api/training/{session_id}/status` remains available for clients that
+cannot consume event streams.
 """
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import json
+from typing import AsyncIterator, List, Tuple
 
 import httpx
 
-from backend.api.routes.training import register_model_definition
+try:
+    # Installed with uvicorn[standard] on Linux/macOS; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
 
 BASE_URL = "http://localhost:8000/api"
-MODEL_ID = "example_mlp"
-DATASET_ID = "iris"
-
-LAYERS: List[dict] = [
-    {"type": "input", "neurons": 4, "activation": None, "position": 0},
-    {"type": "hidden", "neurons": 16, "activation": "relu", "position": 1},
-    {"type": "output", "neurons": 3, "activation": "softmax", "position": 2},
-]
-
-
-def ensure_model_registered() -> None:
-    """Register the demo model once per process."""
-
-    register_model_definition(MODEL_ID, DATASET_ID, LAYERS)
+# Template models are seeded into the database at API startup
+MODEL_ID = "iris_simple"
 
 
 def _print_metrics(metrics: List[dict]) -> None:
@@ -42,37 +38,43 @@ def _print_metrics(metrics: List[dict]) -> None:
             print(f"epoch={epoch:03d} loss={loss:.4f} acc={acc:.3f}")
 
 
-async def main() -> None:
-    ensure_model_registered()
+async def _iter_events(response: httpx.Response) -> AsyncIterator[Tuple[str, dict]]:
+    """Parse a text/event-stream body into (event, data) pairs."""
+    event, data = "message", ""
+    async for line in response.aiter_lines():
+        if line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data += line[len("data:") :].strip()
+        elif not line and data:
+            yield event, json.loads(data)
+            event, data = "message", ""
+
 
-    async with httpx.AsyncClient(base_url=BASE_URL, timeout=60.0) as client:
+async def main() -> None:
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=httpx.Timeout(60.0, read=None),
+        limits=httpx.Limits(keepalive_expiry=30),
+    ) as client:
         start_resp = await client.post(f"/models/{MODEL_ID}/train", json={"max_samples": 200})
         start_resp.raise_for_status()
         start_payload = start_resp.json()
         session_id = start_payload["session_id"]
         print(f"Started session {session_id} (status={start_payload['status']})")
 
-        since_epoch = 0
-        while True:
-            status_resp = await client.get(
-                f"/training/{session_id}/status",
-                params={"since_epoch": since_epoch},
-            )
-            status_resp.raise_for_status()
-            payload = status_resp.json()
-            new_metrics = payload["metrics"]
-            if new_metrics:
-                since_epoch = new_metrics[-1]["epoch"]
-                _print_metrics(new_metrics)
-
-            if payload["status"] in {"completed", "failed"}:
-                print(f"Training finished with status={payload['status']}")
-                if payload.get("error_message"):
-                    print(f"Error: {payload['error_message']}")
-                break
-
-            await asyncio.sleep(payload["poll_interval_seconds"])
+        async with client.stream("GET", f"/training/{session_id}/stream") as stream:
+            stream.raise_for_status()
+            async for event, payload in _iter_events(stream):
+                if event == "metric":
+                    _print_metrics([payload])
+                elif event == "status" and payload["status"] in {"completed", "failed", "stopped"}:
+                    print(f"Training finished with status={payload['status']}")
+                    if payload.get("error_message"):
+                        print(f"Error: {payload['error_message']}")
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -1,12 +1,47 @@
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
-    APP_NAME: str = "FastAPI App"
-    DATABASE_URL: str = "sqlite:///./nn_playground.db"
-    ALLOWED_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
+# Populate os.environ from .env; variables already set in the environment win
+load_dotenv(".env")
 
-    model_config = {"env_file": ".env", "extra": "ignore"}
 
+def _env(name: str, default: str):
+    return field(default_factory=lambda: os.getenv(name, default))
 
-settings = Settings()
+
+def _env_int(name: str, default: int):
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    APP_NAME: str = _env("APP_NAME", "FastAPI App")
+    DATABASE_URL: str = _env("DATABASE_URL", "sqlite:///./nn_playground.db")
+    # Connection pool sizing; ignored for SQLite
+    DB_POOL_SIZE: int = _env_int("DB_POOL_SIZE", 20)
+    DB_POOL_OVERFLOW: int = _env_int("DB_POOL_OVERFLOW", 30)
+    # Intra-op threads per torch op; 0 keeps torch's default (one per core).
+    # Concurrent training jobs share the cores, so a server running several
+    # at once can set this to roughly cores / concurrent jobs.
+    TORCH_NUM_THREADS: int = _env_int("TORCH_NUM_THREADS", 0)
+    ALLOWED_ORIGINS: str = _env(
+        "ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:3000"
+    )
+    ALLOWED_ORIGINS_LIST: List[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        origins = [o.strip() for o in self.ALLOWED_ORIGINS.split(",") if o.strip()]
+        object.__setattr__(self, "ALLOWED_ORIGINS_LIST", origins)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings; `.env` is read once."""
+    return Settings()
+
+
+settings = get_settings()
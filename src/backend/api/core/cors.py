@@ -4,10 +4,9 @@ from backend.api.core.config import settings
 
 
 def init_cors(app):
-    origins = [o.strip() for o in settings.ALLOWED_ORIGINS.split(",") if o.strip()]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=settings.ALLOWED_ORIGINS_LIST,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
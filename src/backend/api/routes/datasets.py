@@ -11,59 +11,96 @@ Assumes teammate has created:
 - backend.datasets.base (BaseDataset)
 - Pydantic models for responses (DatasetMetadata, DatasetPreview)
 """
-from typing import List
+import asyncio
+from functools import lru_cache
+from typing import List, Tuple
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 # Import teammate's dataset infrastructure
-from backend.datasets import get_dataset, list_datasets
+from backend.datasets import BaseDataset, get_dataset, list_datasets
 
 router = APIRouter(prefix="/api/datasets", tags=["datasets"])
 
+PREVIEW_MAX_SAMPLES = 500
 
-@router.get("", response_model=List[dict])
-def list_all_datasets():
-    """
-    List all available datasets with metadata.
 
-    Returns:
-        List of dataset metadata objects
-    """
-    dataset_ids = list_datasets()
-    datasets_metadata = []
+def _base_metadata(dataset_id: str, dataset: BaseDataset) -> dict:
+    return {
+        "id": dataset_id,
+        "name": dataset.name,
+        "task_type": dataset.task_type,
+        "description": dataset.description,
+        "num_samples": dataset.num_samples,
+        "num_features": dataset.num_features,
+        "num_classes": dataset.num_classes,
+        "hyperparameters": {
+            "learning_rate": dataset.hyperparameters.learning_rate,
+            "batch_size": dataset.hyperparameters.batch_size,
+            "epochs": dataset.hyperparameters.epochs,
+            "optimizer": dataset.hyperparameters.optimizer,
+        },
+    }
+
+
+# Whether a registered dataset constructs cleanly; a broken one is probed once
+# per process instead of raising on every request. Probing imports only that
+# dataset's module, so other datasets' dependencies stay unloaded.
+@lru_cache(maxsize=None)
+def _probe_dataset(dataset_id: str) -> bool:
+    try:
+        get_dataset(dataset_id)
+    except Exception:
+        return False
+    return True
 
-    for dataset_id in dataset_ids:
-        try:
-            dataset = get_dataset(dataset_id)
-
-            # Build metadata from teammate's BaseDataset
-            metadata = {
-                "id": dataset_id,
-                "name": dataset.name,
-                "task_type": dataset.task_type,
-                "description": dataset.description,
-                "num_samples": dataset.num_samples,
-                "num_features": dataset.num_features,
-                "num_classes": dataset.num_classes,
-                "output_shape": dataset.num_classes,  # Alias for frontend compatibility
-                "hyperparameters": {
-                    "learning_rate": dataset.hyperparameters.learning_rate,
-                    "batch_size": dataset.hyperparameters.batch_size,
-                    "epochs": dataset.hyperparameters.epochs,
-                    "optimizer": dataset.hyperparameters.optimizer,
-                },
-            }
-            datasets_metadata.append(metadata)
 
-        except Exception:
-            # Skip datasets that fail to load
+def _is_healthy_dataset(dataset_id: str) -> bool:
+    # Check registration first so unknown ids never grow the probe cache
+    return dataset_id in list_datasets() and _probe_dataset(dataset_id)
+
+
+# Dataset metadata is static class-level data, so build it once per process.
+@lru_cache(maxsize=1)
+def _dataset_listing() -> List[dict]:
+    datasets_metadata = []
+    for dataset_id in list_datasets():
+        if not _probe_dataset(dataset_id):
             continue
 
+        dataset = get_dataset(dataset_id)
+        metadata = _base_metadata(dataset_id, dataset)
+        metadata[
+            "output_shape"
+        ] = dataset.num_classes  # Alias for frontend compatibility
+        datasets_metadata.append(metadata)
     return datasets_metadata
 
 
-@router.get("/{dataset_id}", response_model=dict)
-def get_dataset_details(dataset_id: str):
+@lru_cache(maxsize=32)
+def _dataset_details(dataset_id: str) -> dict:
+    dataset = get_dataset(dataset_id)
+    metadata = _base_metadata(dataset_id, dataset)
+    metadata["input_shape"] = dataset.num_features
+    metadata["output_shape"] = dataset.num_classes
+    return metadata
+
+
+@router.get("")
+async def list_all_datasets():
+    """
+    List all available datasets with metadata.
+
+    Returns:
+        List of dataset metadata objects
+    """
+    return _dataset_listing()
+
+
+@router.get("/{dataset_id}")
+async def get_dataset_details(dataset_id: str):
     """
     Get detailed information about a specific dataset.
 
@@ -73,35 +110,21 @@ def get_dataset_details(dataset_id: str):
     Returns:
         Dataset metadata including hyperparameters and dimensions
     """
-    try:
-        dataset = get_dataset(dataset_id)
-    except Exception:
+    if not _is_healthy_dataset(dataset_id):
         raise HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found")
+    return _dataset_details(dataset_id)
 
-    # Build detailed metadata
-    metadata = {
-        "id": dataset_id,
-        "name": dataset.name,
-        "task_type": dataset.task_type,
-        "description": dataset.description,
-        "num_samples": dataset.num_samples,
-        "num_features": dataset.num_features,
-        "num_classes": dataset.num_classes,
-        "hyperparameters": {
-            "learning_rate": dataset.hyperparameters.learning_rate,
-            "batch_size": dataset.hyperparameters.batch_size,
-            "epochs": dataset.hyperparameters.epochs,
-            "optimizer": dataset.hyperparameters.optimizer,
-        },
-        "input_shape": dataset.num_features,
-        "output_shape": dataset.num_classes,
-    }
 
-    return metadata
+# Preview rows come from a fixed 500-sample load; BaseDataset.load memoizes
+# the split, so later previews only slice the shared arrays.
+def _load_preview(dataset_id: str) -> Tuple[np.ndarray, np.ndarray]:
+    dataset = get_dataset(dataset_id, max_samples=PREVIEW_MAX_SAMPLES)
+    X_train, y_train, _, _ = dataset.load(test_size=0.2)
+    return X_train, y_train
 
 
-@router.get("/{dataset_id}/preview", response_model=dict)
-def get_dataset_preview(
+@router.get("/{dataset_id}/preview", response_class=ORJSONResponse)
+async def get_dataset_preview(
     dataset_id: str,
     num_samples: int = Query(
         default=10, ge=1, le=100, description="Number of samples to preview"
@@ -117,29 +140,27 @@ def get_dataset_preview(
     Returns:
         DatasetPreview with features, labels, and sample count
     """
-    try:
-        # Load a reasonable amount of data (don't limit with max_samples in constructor)
-        # to avoid issues with train/test split
-        dataset = get_dataset(dataset_id, max_samples=min(500, num_samples * 10))
-    except Exception:
+    if not _is_healthy_dataset(dataset_id):
         raise HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found")
 
     try:
-        # Load data using teammate's method
-        X_train, y_train, X_test, y_test = dataset.load(test_size=0.2)
-
-        # Take first num_samples from training set
+        dataset = get_dataset(dataset_id, max_samples=PREVIEW_MAX_SAMPLES)
+        if dataset.is_loaded(test_size=0.2):
+            X_train, y_train, _, _ = dataset.load(test_size=0.2)
+        else:
+            # Cache miss: load + split is CPU/IO heavy, keep it off the event loop
+            X_train, y_train, _, _ = await asyncio.to_thread(dataset.load, 0.2)
+
+        # Take first num_samples from training set; orjson serializes the
+        # numpy slices straight from their buffers (no .tolist() boxing)
         actual_samples = min(num_samples, len(X_train))
-        features = X_train[:actual_samples].tolist()
-        labels = y_train[:actual_samples].tolist()
-
-        preview = {
-            "features": features,
-            "labels": labels,
-            "num_samples_shown": len(features),
-        }
-
-        return preview
+        return ORJSONResponse(
+            {
+                "features": X_train[:actual_samples],
+                "labels": y_train[:actual_samples],
+                "num_samples_shown": actual_samples,
+            }
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -9,22 +9,30 @@ users cannot create unusable graphs.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from operator import attrgetter
+from typing import Annotated, Any, List, Literal, Optional, Union, get_args
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field, conint
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    conint,
+    field_validator,
+)
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
-from backend.datasets import list_datasets
+from backend.datasets import available_datasets
 from backend.db_models import ModelConfigDB
 
 router = APIRouter(prefix="/api/models", tags=["models"])
 
-ALLOWED_LAYER_TYPES = {"input", "hidden", "output"}
-ALLOWED_ACTIVATIONS = {
-    None,
+LayerType = Literal["input", "hidden", "output"]
+Activation = Literal[
     "relu",
     "sigmoid",
     "tanh",
@@ -35,25 +43,61 @@ ALLOWED_ACTIVATIONS = {
     "elu",
     "softplus",
     "linear",
-}
+]
 
+# Softmax normalizes the network's output, so it is only valid on the output layer
+HiddenActivation = Literal[
+    "relu",
+    "sigmoid",
+    "tanh",
+    "gelu",
+    "leaky_relu",
+    "selu",
+    "elu",
+    "softplus",
+    "linear",
+]
+
+ALLOWED_LAYER_TYPES = set(get_args(LayerType))
+ALLOWED_ACTIVATIONS = {None, *get_args(Activation)}
 
-class LayerConfig(BaseModel):
-    """Single layer description supplied by the frontend."""
 
-    type: str = Field(..., description="Layer kind such as input, hidden, output")
+class _LayerBase(BaseModel):
+    # Subclasses narrow `type` and `activation`; fields keep this order
+    type: LayerType = Field(..., description="Layer kind such as input, hidden, output")
     neurons: conint(gt=0) = Field(
         ..., description="Number of units/neurons in the layer"
     )
-    activation: Optional[str] = Field(
-        default=None,
-        description="Activation function (None for input layers)",
-        max_length=32,
+    activation: Optional[Activation] = Field(
+        default=None, description="Activation function (None for input layers)"
     )
     position: conint(ge=0) = Field(..., description="Zero-indexed layer order")
 
-    class Config:
-        schema_extra = {
+    @field_validator("type", "activation", mode="before")
+    @classmethod
+    def _lowercase(cls, value: Any) -> Any:
+        return value.lower() if isinstance(value, str) else value
+
+
+class InputLayer(_LayerBase):
+    """Input layer; it only fixes the feature count, so no activation."""
+
+    type: Literal["input"]
+    activation: Optional[Literal["linear"]] = Field(
+        default=None, description="Input layers cannot define an activation"
+    )
+
+
+class HiddenLayer(_LayerBase):
+    """Hidden layer description supplied by the frontend."""
+
+    type: Literal["hidden"]
+    activation: Optional[HiddenActivation] = Field(
+        default=None, description="Hidden layers cannot use softmax"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "type": "hidden",
                 "neurons": 128,
@@ -61,6 +105,39 @@ class LayerConfig(BaseModel):
                 "position": 1,
             }
         }
+    )
+
+
+class OutputLayer(_LayerBase):
+    """Output layer description supplied by the frontend."""
+
+    type: Literal["output"]
+
+
+def _layer_tag(value: Any) -> Optional[str]:
+    layer_type = (
+        value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    )
+    return layer_type.lower() if isinstance(layer_type, str) else None
+
+
+# Single layer description; pydantic-core dispatches on `type` directly
+LayerConfig = Annotated[
+    Union[
+        Annotated[InputLayer, Tag("input")],
+        Annotated[HiddenLayer, Tag("hidden")],
+        Annotated[OutputLayer, Tag("output")],
+    ],
+    Discriminator(_layer_tag),
+]
+
+_LAYER_MODELS = {"input": InputLayer, "hidden": HiddenLayer, "output": OutputLayer}
+
+
+def _stored_layers(layers: List[dict]) -> List[LayerConfig]:
+    # Stored layers were validated when written (or are trusted templates),
+    # so skip a second validation pass on read.
+    return [_LAYER_MODELS[layer["type"]].model_construct(**layer) for layer in layers]
 
 
 class ModelCreateRequest(BaseModel):
@@ -82,12 +159,12 @@ class ModelCreateRequest(BaseModel):
     )
     layers: List[LayerConfig] = Field(
         ...,
-        min_items=2,
+        min_length=2,
         description="Ordered list of layer configurations",
     )
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Custom MNIST model",
                 "dataset_id": "mnist",
@@ -113,6 +190,7 @@ class ModelCreateRequest(BaseModel):
                 ],
             }
         }
+    )
 
 
 class ModelResponse(BaseModel):
@@ -126,16 +204,15 @@ class ModelResponse(BaseModel):
     created_at: datetime
     status: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 def _ensure_dataset_exists(dataset_id: str) -> None:
-    available_datasets = set(list_datasets())
-    if dataset_id not in available_datasets:
+    registered = available_datasets()
+    if dataset_id not in registered:
         raise HTTPException(
             status_code=400,
-            detail=f"Dataset '{dataset_id}' is not registered. Available: {sorted(available_datasets)}",
+            detail=f"Dataset '{dataset_id}' is not registered. Available: {sorted(registered)}",
         )
 
 
@@ -145,61 +222,34 @@ def _validate_layers(layers: List[LayerConfig]) -> List[LayerConfig]:
             status_code=400, detail="Provide at least input and output layers"
         )
 
-    sorted_layers = sorted(layers, key=lambda layer: layer.position)
-    expected_positions = list(range(len(sorted_layers)))
-    actual_positions = [layer.position for layer in sorted_layers]
-    if actual_positions != expected_positions:
-        raise HTTPException(
-            status_code=400,
-            detail="Layer positions must be contiguous starting at 0",
-        )
-
-    type_counts = {layer_type: 0 for layer_type in ALLOWED_LAYER_TYPES}
-    normalized_layers: List[LayerConfig] = []
-    for layer in sorted_layers:
-        layer_type = layer.type.lower()
-        if layer_type not in ALLOWED_LAYER_TYPES:
-            allowed = ", ".join(sorted(ALLOWED_LAYER_TYPES))
-            raise HTTPException(
-                status_code=400, detail=f"Layer type must be one of: {allowed}"
-            )
-
-        activation = (
-            layer.activation.lower() if isinstance(layer.activation, str) else None
-        )
-        if activation not in ALLOWED_ACTIVATIONS:
-            allowed = sorted(filter(None, ALLOWED_ACTIVATIONS))
-            raise HTTPException(
-                status_code=400, detail=f"Activation must be one of {allowed} or null"
-            )
+    sorted_layers = sorted(layers, key=attrgetter("position"))
 
-        type_counts[layer_type] += 1
-        if layer_type == "input" and activation not in (None, "linear"):
+    # Type, activation and input-activation rules are enforced by the schema;
+    # only cross-layer structure is checked here, in a single pass.
+    input_count = output_count = 0
+    for expected_position, layer in enumerate(sorted_layers):
+        if layer.position != expected_position:
             raise HTTPException(
-                status_code=400, detail="Input layers cannot define an activation"
-            )
-
-        normalized_layers.append(
-            LayerConfig(
-                type=layer_type,
-                neurons=layer.neurons,
-                activation=activation,
-                position=layer.position,
+                status_code=400,
+                detail="Layer positions must be contiguous starting at 0",
             )
-        )
+        if layer.type == "input":
+            input_count += 1
+        elif layer.type == "output":
+            output_count += 1
 
-    if type_counts["input"] != 1 or type_counts["output"] != 1:
+    if input_count != 1 or output_count != 1:
         raise HTTPException(
             status_code=400,
             detail="Models require exactly one input and one output layer",
         )
 
-    if normalized_layers[0].type != "input" or normalized_layers[-1].type != "output":
+    if sorted_layers[0].type != "input" or sorted_layers[-1].type != "output":
         raise HTTPException(
             status_code=400, detail="Layers must start with input and end with output"
         )
 
-    return normalized_layers
+    return sorted_layers
 
 
 @router.post("", response_model=ModelResponse, status_code=201)
@@ -211,7 +261,7 @@ def create_model(
     """
     _ensure_dataset_exists(config.dataset_id)
     validated_layers = _validate_layers(config.layers)
-    model_id = str(uuid4())
+    model_id = uuid4().hex
     name = config.name or f"{config.dataset_id}_model"
 
     db_model = ModelConfigDB(
@@ -250,7 +300,7 @@ def get_model(model_id: str, db: Session = Depends(get_db)) -> ModelResponse:
         name=db_model.name,
         dataset_id=db_model.dataset_id,
         description=db_model.description,
-        layers=[LayerConfig(**layer) for layer in db_model.layers],
+        layers=_stored_layers(db_model.layers),
         created_at=db_model.created_at,
         status=db_model.status,
     )
@@ -258,8 +308,11 @@ def get_model(model_id: str, db: Session = Depends(get_db)) -> ModelResponse:
 
 def clear_model_store(db: Session) -> None:
     """Helper used by tests to start from a clean in-memory store."""
+    from backend.api.routes.training import _model_registry
+
     db.query(ModelConfigDB).delete()
     db.commit()
+    _model_registry.invalidate()
 
 
 __all__ = [
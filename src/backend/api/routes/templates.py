@@ -5,22 +5,58 @@ Provides:
 - GET /api/templates - List all templates (optionally filter by dataset)
 - GET /api/templates/{id} - Get template details
 
-Uses templates defined in backend.api.templates module.
+Uses templates defined in backend.api.templates module. Templates are static,
+so every response body is serialized once at import and served with an ETag.
 """
-from typing import List, Optional
+import hashlib
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 # Import template data
 from backend.api import templates
 
 router = APIRouter(prefix="/api/templates", tags=["templates"])
 
+CACHE_CONTROL = "public, max-age=3600"
+
+
+def _serialize(payload) -> Tuple[bytes, str]:
+    """Return (JSON body, strong ETag) for a template payload."""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+_ALL_TEMPLATES = _serialize(templates.list_all_templates())
+_NO_TEMPLATES = _serialize([])
+_TEMPLATES_BY_DATASET: Dict[str, Tuple[bytes, str]] = {
+    dataset_id: _serialize(templates.filter_templates_by_dataset(dataset_id))
+    for dataset_id in {t["dataset_id"] for t in templates.TEMPLATES.values()}
+}
+_TEMPLATE_BY_ID: Dict[str, Tuple[bytes, str]] = {
+    template_id: _serialize(template)
+    for template_id, template in templates.TEMPLATES.items()
+}
+
+
+def _cached_json(request: Request, entry: Tuple[bytes, str]) -> Response:
+    body, etag = entry
+    headers = {"Cache-Control": CACHE_CONTROL, "ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("", response_model=List[dict])
 def list_templates(
-    dataset_id: Optional[str] = Query(None, description="Filter by dataset ID")
-):
+    request: Request,
+    dataset_id: Optional[str] = Query(None, description="Filter by dataset ID"),
+) -> Response:
     """
     List all available neural network templates.
 
@@ -32,15 +68,16 @@ def list_templates(
     """
     if dataset_id:
         # Filter templates by dataset
-        filtered_templates = templates.filter_templates_by_dataset(dataset_id)
-        return filtered_templates
+        return _cached_json(
+            request, _TEMPLATES_BY_DATASET.get(dataset_id, _NO_TEMPLATES)
+        )
     else:
         # Return all templates
-        return templates.list_all_templates()
+        return _cached_json(request, _ALL_TEMPLATES)
 
 
 @router.get("/{template_id}", response_model=dict)
-def get_template_details(template_id: str):
+def get_template_details(template_id: str, request: Request) -> Response:
     """
     Get detailed configuration for a specific template.
 
@@ -50,11 +87,11 @@ def get_template_details(template_id: str):
     Returns:
         Template configuration including layers and hyperparameters
     """
-    template = templates.get_template_by_id(template_id)
+    entry = _TEMPLATE_BY_ID.get(template_id)
 
-    if template is None:
+    if entry is None:
         raise HTTPException(
             status_code=404, detail=f"Template '{template_id}' not found"
         )
 
-    return template
+    return _cached_json(request, entry)
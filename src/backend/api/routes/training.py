@@ -1,32 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import threading
-import time
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
 from dataclasses import dataclass
-from types import MethodType
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import AfterValidator, BaseModel, Field
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, joinedload
 
 from backend.api.schemas.training import (
     LayerConfig,
-    TrainingMetricPayload,
     TrainingStartRequest,
     TrainingStartResponse,
     TrainingStatusResponse,
 )
-from backend.database import SessionLocal, get_db
-from backend.datasets import get_dataset
+from backend.database import get_db, training_sessionmaker
+from backend.datasets import available_datasets
 from backend.db_models import ModelConfigDB, TrainingMetricsDB, TrainingSessionDB
 from backend.training.engine import TrainingEngine
 from backend.training.models import TrainingMetric, TrainingSession
 
+MAX_PREDICTION_BATCH = 1024
+
+
+def _as_float32_array(values: List[float]) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float32)
+
 
 class PredictionRequest(BaseModel):
-    inputs: list
+    # Parsed as floats by pydantic-core, then handed to the engine as one float32 array
+    inputs: Annotated[
+        List[float], Field(min_length=1), AfterValidator(_as_float32_array)
+    ]
 
 
 class PredictionResponse(BaseModel):
@@ -35,15 +60,41 @@ class PredictionResponse(BaseModel):
     confidence: float = None
 
 
+class BatchPredictionRequest(BaseModel):
+    # Rows must be non-empty and share one length; ragged input fails array
+    # conversion with a 422
+    inputs: Annotated[
+        List[Annotated[List[float], Field(min_length=1)]],
+        Field(min_length=1, max_length=MAX_PREDICTION_BATCH),
+        AfterValidator(_as_float32_array),
+    ]
+
+
+class BatchPredictionResponse(BaseModel):
+    predictions: List[Union[int, float]]
+    probabilities: Optional[List[List[float]]] = None
+    confidences: Optional[List[float]] = None
+
+
 router = APIRouter(prefix="/api", tags=["training"])
 
 DEFAULT_POLL_INTERVAL = 1.0
+MAX_LONG_POLL_SECONDS = 30.0
+STREAM_HEARTBEAT_SECONDS = 15.0
+TERMINAL_STATUSES = {"completed", "failed", "stopped"}
+# Finished jobs keep their trained model in memory for predictions; beyond this
+# many, the least recently used ones are dropped (their history stays in the DB)
+MAX_FINISHED_JOBS = 200
 
 
 class ModelAlreadyTrainingError(RuntimeError):
     """Raised when a model has an active training session."""
 
 
+class TrainingCapacityError(RuntimeError):
+    """Raised when every training worker slot is taken."""
+
+
 class ModelNotFoundError(KeyError):
     """Raised when no model metadata exists for the requested ID."""
 
@@ -57,28 +108,62 @@ class ModelDefinition:
     model_id: str
     dataset_id: str
     layers: List[LayerConfig]
+    # Engine-ready form of `layers` (None fields dropped), built from the stored JSON
+    layer_payload: List[dict]
 
 
 class ModelRegistry:
+    def __init__(self) -> None:
+        # Stored model rows are never edited in place, so a definition stays
+        # valid until invalidate() is called by whoever rewrites or deletes it
+        self._definitions: Dict[str, ModelDefinition] = {}
+        self._lock = threading.Lock()
+
     def get(self, model_id: str, db: Session) -> ModelDefinition:
+        definition = self._definitions.get(model_id)
+        if definition is not None:
+            return definition
+
         db_model = db.query(ModelConfigDB).filter(ModelConfigDB.id == model_id).first()
         if db_model is None:
             raise ModelNotFoundError(model_id)
-        layers = [LayerConfig(**layer) for layer in db_model.layers]
-        return ModelDefinition(
-            model_id=db_model.id, dataset_id=db_model.dataset_id, layers=layers
+        # Stored layers were validated when written; don't validate them again
+        layers = [LayerConfig.model_construct(**layer) for layer in db_model.layers]
+        layer_payload = [
+            {key: value for key, value in layer.items() if value is not None}
+            for layer in db_model.layers
+        ]
+        definition = ModelDefinition(
+            model_id=db_model.id,
+            dataset_id=db_model.dataset_id,
+            layers=layers,
+            layer_payload=layer_payload,
         )
+        with self._lock:
+            self._definitions[model_id] = definition
+        return definition
+
+    def invalidate(self, model_id: Optional[str] = None) -> None:
+        """Drop the cached definition for `model_id`, or every definition if None."""
+        with self._lock:
+            if model_id is None:
+                self._definitions.clear()
+            else:
+                self._definitions.pop(model_id, None)
 
     def seed_from_templates(self, db: Session) -> None:
         from backend.api import templates as template_data
 
-        for template in template_data.list_all_templates():
-            existing = (
-                db.query(ModelConfigDB)
-                .filter(ModelConfigDB.id == template["id"])
-                .first()
+        templates = template_data.list_all_templates()
+        # One IN query for all template ids instead of a lookup per template
+        existing = {
+            model_id
+            for (model_id,) in db.query(ModelConfigDB.id).filter(
+                ModelConfigDB.id.in_([template["id"] for template in templates])
             )
-            if existing:
+        }
+        for template in templates:
+            if template["id"] in existing:
                 continue
             db_model = ModelConfigDB(
                 id=template["id"],
@@ -89,6 +174,9 @@ class ModelRegistry:
             )
             db.add(db_model)
         db.commit()
+        for template in templates:
+            if template["id"] not in existing:
+                self.invalidate(template["id"])
 
 
 @dataclass
@@ -100,13 +188,28 @@ class TrainingJob:
 
 
 class TrainingSessionManager:
-    def __init__(self, max_workers: int = 2) -> None:
+    def __init__(
+        self, max_workers: int = 2, max_finished_jobs: int = MAX_FINISHED_JOBS
+    ) -> None:
         # _jobs stays in-memory: holds live TrainingEngine + Future (can't serialize)
-        self._jobs: Dict[str, TrainingJob] = {}
+        self._jobs: Mapping[str, TrainingJob] = MappingProxyType({})
         # _model_sessions tracks which model has an active training run (runtime lock)
-        self._model_sessions: Dict[str, str] = {}
+        self._model_sessions: Mapping[str, str] = MappingProxyType({})
+        # Writers hold _lock and swap in a new read-only snapshot (copy-on-write),
+        # so readers can do a plain, lock-free lookup on the current one
         self._lock = threading.Lock()
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Finished session ids in least-recently-used order (guarded by _lock)
+        self._finished_jobs: "OrderedDict[str, None]" = OrderedDict()
+        self._max_finished_jobs = max_finished_jobs
+        # Long-poll waiters per session; one update wakes all of them at once
+        self._subscribers: Dict[
+            str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = defaultdict(set)
+        # Each job runs on its own thread; the semaphore caps how many run at once
+        self._max_workers = max_workers
+        self._training_slots = threading.BoundedSemaphore(max_workers)
+        # One connection per worker plus one spare for a finish racing a start
+        self._completion_sessions = training_sessionmaker(max_workers + 1)
 
     def start_training(
         self,
@@ -115,20 +218,20 @@ class TrainingSessionManager:
         layers: List[LayerConfig],
         *,
         db: Session,
+        layer_payload: Optional[List[dict]] = None,
         max_samples: Optional[int] = None,
         epochs: Optional[int] = None,
         learning_rate: Optional[float] = None,
         batch_size: Optional[int] = None,
         optimizer: Optional[str] = None,
     ) -> TrainingSession:
-        with self._lock:
-            active_session = self._model_sessions.get(model_id)
-            if active_session and active_session in self._jobs:
-                job = self._jobs[active_session]
-                if job.engine.session and job.engine.session.status == "running":
-                    raise ModelAlreadyTrainingError(active_session)
+        active_session = self._model_sessions.get(model_id)
+        job = self._jobs.get(active_session) if active_session else None
+        if job and job.engine.session and job.engine.session.status == "running":
+            raise ModelAlreadyTrainingError(active_session)
 
-        layer_payload = [layer.model_dump(exclude_none=True) for layer in layers]
+        if layer_payload is None:
+            layer_payload = [layer.model_dump(exclude_none=True) for layer in layers]
         engine = TrainingEngine(
             dataset_id=dataset_id,
             model_config={"layers": layer_payload},
@@ -136,10 +239,20 @@ class TrainingSessionManager:
             learning_rate=learning_rate,
             batch_size=batch_size,
             optimizer=optimizer,
+            max_samples=max_samples,
         )
-        _inject_max_samples(engine, max_samples)
-
-        future = self._executor.submit(engine.train, model_id)
+        engine.add_update_listener(lambda: self._notify_engine_update(engine))
+
+        # Refuse rather than queue: a queued job would never report a session
+        if not self._training_slots.acquire(blocking=False):
+            raise TrainingCapacityError(self._max_workers)
+        future: Future = Future()
+        threading.Thread(
+            target=self._run_job,
+            args=(engine, model_id, future),
+            name=f"training-{model_id}",
+            daemon=True,
+        ).start()
         session = _wait_for_session_initialization(engine)
 
         # Persist session to DB
@@ -156,14 +269,14 @@ class TrainingSessionManager:
         db.commit()
 
         # Keep job in memory (engine + future can't go to DB)
+        job = TrainingJob(
+            model_id=model_id, dataset_id=dataset_id, engine=engine, future=future
+        )
         with self._lock:
-            self._jobs[session.session_id] = TrainingJob(
-                model_id=model_id,
-                dataset_id=dataset_id,
-                engine=engine,
-                future=future,
+            self._jobs = MappingProxyType({**self._jobs, session.session_id: job})
+            self._model_sessions = MappingProxyType(
+                {**self._model_sessions, model_id: session.session_id}
             )
-            self._model_sessions[model_id] = session.session_id
 
         # When training finishes, persist final metrics to DB and clean up
         future.add_done_callback(
@@ -171,75 +284,189 @@ class TrainingSessionManager:
         )
         return session
 
+    def _run_job(self, engine: TrainingEngine, model_id: str, future: Future) -> None:
+        """Thread body for one training job; frees its worker slot when done."""
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = engine.train(model_id)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        finally:
+            self._training_slots.release()
+
     def _on_training_complete(
         self, model_id: str, session_id: str, engine: TrainingEngine
     ) -> None:
         """Called in background thread when training future completes. Persists final state to DB."""
-        db = SessionLocal()
-        try:
-            db_session = (
-                db.query(TrainingSessionDB)
-                .filter(TrainingSessionDB.session_id == session_id)
-                .first()
-            )
-            if db_session and engine.session:
-                db_session.status = engine.session.status
-                db_session.current_epoch = engine.session.current_epoch
-                db_session.end_time = engine.session.end_time
-                db_session.error_message = engine.session.error_message
-
-                # Persist all metrics
-                for metric in engine.session.metrics:
-                    db_metric = TrainingMetricsDB(
-                        session_id=session_id,
-                        epoch=metric.epoch,
-                        loss=metric.loss,
-                        accuracy=metric.accuracy,
-                        timestamp=metric.timestamp,
+        with self._completion_sessions() as db:
+            session = engine.session
+            if session is not None:
+                # One UPDATE instead of SELECT + ORM flush; rowcount 0 means no row
+                result = db.execute(
+                    update(TrainingSessionDB)
+                    .where(TrainingSessionDB.session_id == session_id)
+                    .values(
+                        status=session.status,
+                        current_epoch=session.current_epoch,
+                        end_time=session.end_time,
+                        error_message=session.error_message,
+                    )
+                )
+                # Persist all metrics as one executemany INSERT
+                if result.rowcount and session.metrics:
+                    db.execute(
+                        insert(TrainingMetricsDB),
+                        [
+                            {
+                                "session_id": session_id,
+                                "epoch": metric.epoch,
+                                "loss": metric.loss,
+                                "accuracy": metric.accuracy,
+                                "timestamp": metric.timestamp,
+                            }
+                            for metric in session.metrics
+                        ],
                     )
-                    db.add(db_metric)
                 db.commit()
-        finally:
-            db.close()
 
         # Clean up in-memory tracking
         with self._lock:
-            current = self._model_sessions.get(model_id)
-            if current == session_id:
-                self._model_sessions.pop(model_id, None)
+            if self._model_sessions.get(model_id) == session_id:
+                self._model_sessions = MappingProxyType(
+                    {
+                        key: value
+                        for key, value in self._model_sessions.items()
+                        if key != model_id
+                    }
+                )
+            self._finished_jobs[session_id] = None
+            evicted = set()
+            while len(self._finished_jobs) > self._max_finished_jobs:
+                evicted.add(self._finished_jobs.popitem(last=False)[0])
+            if evicted:
+                self._jobs = MappingProxyType(
+                    {
+                        key: value
+                        for key, value in self._jobs.items()
+                        if key not in evicted
+                    }
+                )
+
+        self._notify_status_changed(session_id)
+
+    def _notify_engine_update(self, engine: TrainingEngine) -> None:
+        if engine.session is not None:
+            self._notify_status_changed(engine.session.session_id)
 
-    def get_session(self, session_id: str, db: Session) -> TrainingSession:
-        """Return live session if training is active, otherwise load from DB."""
-        # Check for live job first (has real-time metrics)
+    def _notify_status_changed(self, session_id: str) -> None:
+        """Wake every long-poll waiter on `session_id` (safe from any thread)."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(session_id, ()))
+        for loop, event in subscribers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Waiter's event loop already closed
+                pass
+
+    async def wait_for_update(
+        self,
+        session_id: str,
+        since_status: Optional[str],
+        since_epoch: int,
+        timeout: float,
+    ) -> None:
+        """Wait until a live session leaves `since_status` or records an epoch past `since_epoch`.
+
+        Returns immediately for unknown or historical sessions; callers read the
+        current state afterwards either way.
+        """
+        job = self._jobs.get(session_id)
+        if job is None or job.engine.session is None:
+            return
+
+        session = job.engine.session
+        last_status = since_status or session.status
+
+        def _changed() -> bool:
+            if session.status != last_status:
+                return True
+            return bool(session.metrics) and session.metrics[-1].epoch > since_epoch
+
+        loop = asyncio.get_running_loop()
+        subscriber = (loop, asyncio.Event())
         with self._lock:
-            job = self._jobs.get(session_id)
+            self._subscribers[session_id].add(subscriber)
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                # Clear before checking so an update landing in between is not lost
+                subscriber[1].clear()
+                remaining = deadline - loop.time()
+                if _changed() or remaining <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(subscriber[1].wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return
+        finally:
+            with self._lock:
+                waiters = self._subscribers.get(session_id)
+                if waiters is not None:
+                    waiters.discard(subscriber)
+                    if not waiters:
+                        del self._subscribers[session_id]
+
+    def get_session(
+        self, session_id: str, db: Session, since_epoch: int = 0
+    ) -> TrainingSession:
+        """Return live session if training is active, otherwise load from DB.
+
+        Sessions loaded from the DB only carry metrics past `since_epoch`;
+        live sessions always carry the full list.
+        """
+        return self.get_session_and_job(session_id, db, since_epoch)[0]
+
+    def get_session_and_job(
+        self, session_id: str, db: Session, since_epoch: int = 0
+    ) -> Tuple[TrainingSession, Optional[TrainingJob]]:
+        """Return the session plus its in-memory job (None for DB-only sessions)."""
+        # Check for live job first (has real-time metrics)
+        job = self._jobs.get(session_id)
         if job and job.engine.session:
-            return job.engine.session
+            self._touch_finished_job(session_id)
+            return job.engine.session, job
 
         # Fall back to DB for completed/historical sessions
+        return self._load_session(session_id, db, since_epoch), None
+
+    def _load_session(
+        self, session_id: str, db: Session, since_epoch: int = 0
+    ) -> TrainingSession:
+        # Session row and its unseen metrics (ordered by the relationship) in one query
+        unseen = TrainingSessionDB.metrics.and_(TrainingMetricsDB.epoch > since_epoch)
         db_session = (
             db.query(TrainingSessionDB)
+            .options(joinedload(unseen))
             .filter(TrainingSessionDB.session_id == session_id)
             .first()
         )
         if db_session is None:
             raise SessionNotFoundError(session_id)
 
-        db_metrics = (
-            db.query(TrainingMetricsDB)
-            .filter(TrainingMetricsDB.session_id == session_id)
-            .order_by(TrainingMetricsDB.epoch)
-            .all()
-        )
-
+        # Rows were written from validated engine state; skip re-validation
         metrics = [
-            TrainingMetric(
+            TrainingMetric.model_construct(
                 epoch=m.epoch, loss=m.loss, accuracy=m.accuracy, timestamp=m.timestamp
             )
-            for m in db_metrics
+            for m in db_session.metrics
         ]
 
-        return TrainingSession(
+        return TrainingSession.model_construct(
             session_id=db_session.session_id,
             model_id=db_session.model_id,
             dataset_id=db_session.dataset_id,
@@ -253,17 +480,23 @@ class TrainingSessionManager:
         )
 
     def get_job(self, session_id: str) -> TrainingJob:
-        """Get the live training job (in-memory only — only exists while training is active)."""
-        with self._lock:
-            job = self._jobs.get(session_id)
+        """Get the in-memory training job (running, or finished and not yet evicted)."""
+        job = self._jobs.get(session_id)
         if job is None:
             raise SessionNotFoundError(session_id)
+        self._touch_finished_job(session_id)
         return job
 
+    def _touch_finished_job(self, session_id: str) -> None:
+        """Mark a finished job as recently used so it is evicted last."""
+        if session_id in self._finished_jobs:
+            with self._lock:
+                if session_id in self._finished_jobs:
+                    self._finished_jobs.move_to_end(session_id)
+
     def stop_session(self, session_id: str) -> TrainingSession:
         """Request a training session to stop."""
-        with self._lock:
-            job = self._jobs.get(session_id)
+        job = self._jobs.get(session_id)
 
         if job is None:
             raise SessionNotFoundError(session_id)
@@ -274,12 +507,12 @@ class TrainingSessionManager:
 
         job.engine.request_stop()
         session.status = "stopped"
+        self._notify_status_changed(session_id)
         return session
 
     def pause_session(self, session_id: str) -> TrainingSession:
         """Pause an ongoing training session."""
-        with self._lock:
-            job = self._jobs.get(session_id)
+        job = self._jobs.get(session_id)
 
         if job is None:
             raise SessionNotFoundError(session_id)
@@ -290,12 +523,12 @@ class TrainingSessionManager:
 
         job.engine.request_pause()
         session.status = "paused"
+        self._notify_status_changed(session_id)
         return session
 
     def resume_session(self, session_id: str) -> TrainingSession:
         """Resume a paused training session."""
-        with self._lock:
-            job = self._jobs.get(session_id)
+        job = self._jobs.get(session_id)
 
         if job is None:
             raise SessionNotFoundError(session_id)
@@ -306,50 +539,114 @@ class TrainingSessionManager:
 
         job.engine.resume()
         session.status = "running"
+        self._notify_status_changed(session_id)
         return session
 
 
-def _inject_max_samples(engine: TrainingEngine, max_samples: Optional[int]) -> None:
-    if max_samples is None:
-        return
-
-    def _patched_prepare(self) -> tuple:
-        return TrainingEngine._prepare_data(self, max_samples=max_samples)
-
-    engine._prepare_data = MethodType(_patched_prepare, engine)  # type: ignore[attr-defined]
-
-
 def _wait_for_session_initialization(
     engine: TrainingEngine, timeout: float = 5.0
 ) -> TrainingSession:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if engine.session is not None:
-            return engine.session
-        time.sleep(0.01)
-    raise RuntimeError("Training session failed to initialize")
-
-
-def _build_metric_payloads(
-    metrics: List[TrainingMetric], since_epoch: int
-) -> List[TrainingMetricPayload]:
-    return [
-        TrainingMetricPayload(
-            epoch=metric.epoch,
-            loss=metric.loss,
-            accuracy=metric.accuracy,
-            timestamp=metric.timestamp,
-        )
-        for metric in metrics
-        if metric.epoch > since_epoch
-    ]
+    session = engine.wait_for_session(timeout)
+    if session is None:
+        raise RuntimeError("Training session failed to initialize")
+    return session
+
+
+def _metric_json(session: TrainingSession) -> List[str]:
+    """Return the JSON encoding of every recorded metric, indexed like `session.metrics`.
+
+    Each metric is serialized once and cached on the session. The engine
+    appends exactly one metric per epoch starting at 1, so for a live session
+    the epochs after `since_epoch` are simply `_metric_json(session)[since_epoch:]`.
+    """
+    encoded = session._metric_json
+    cached = len(encoded)
+    for metric in session.metrics[cached:]:
+        encoded.append(metric.model_dump_json())
+    return encoded
 
 
 def _calculate_progress(session: TrainingSession) -> float:
-    if session.total_epochs <= 0:
+    # Integer comparisons cover the not-started and finished cases without dividing
+    if session.total_epochs <= 0 or session.current_epoch <= 0:
         return 0.0
-    progress = session.current_epoch / session.total_epochs
-    return min(1.0, max(0.0, progress))
+    if session.current_epoch >= session.total_epochs:
+        return 1.0
+    return session.current_epoch / session.total_epochs
+
+
+def _json_response(
+    payload: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    # Returning a Response makes FastAPI skip re-validating against
+    # response_model (which still documents the schema); pydantic-core
+    # serializes straight to JSON bytes.
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _format_sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _stream_session_events(
+    session: TrainingSession, engine: Optional[TrainingEngine]
+) -> AsyncIterator[str]:
+    """Yield one `metric` event per epoch and a `status` event per transition.
+
+    Live sessions wake on the engine's update callback; the stream closes after
+    the first terminal status. Sessions without an engine are replayed once.
+    """
+    loop = asyncio.get_running_loop()
+    updates: asyncio.Queue = asyncio.Queue()
+
+    def _on_update() -> None:
+        try:
+            loop.call_soon_threadsafe(updates.put_nowait, None)
+        except RuntimeError:
+            # Event loop already closed; the stream is gone
+            pass
+
+    if engine is not None:
+        engine.add_update_listener(_on_update)
+    try:
+        sent_epoch = 0
+        last_status = None
+        while True:
+            for payload in _metric_json(session)[sent_epoch:]:
+                yield _format_sse("metric", payload)
+                sent_epoch += 1
+
+            if session.status != last_status:
+                last_status = session.status
+                yield _format_sse(
+                    "status",
+                    json.dumps(
+                        {
+                            "session_id": session.session_id,
+                            "status": session.status,
+                            "current_epoch": session.current_epoch,
+                            "total_epochs": session.total_epochs,
+                            "progress": _calculate_progress(session),
+                            "error_message": session.error_message,
+                        }
+                    ),
+                )
+            # Without an engine nothing will change (e.g. a row left "running"
+            # by a restart), so stop after replaying the stored state
+            if last_status in TERMINAL_STATUSES or engine is None:
+                return
+
+            try:
+                await asyncio.wait_for(updates.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        if engine is not None:
+            engine.remove_update_listener(_on_update)
 
 
 _model_registry = ModelRegistry()
@@ -365,7 +662,7 @@ async def start_training_endpoint(
     model_id: str,
     payload: TrainingStartRequest,
     db: Session = Depends(get_db),
-) -> TrainingStartResponse:
+) -> Response:
     if model_id == "new":
         if not payload.dataset_id or not payload.layers:
             raise HTTPException(
@@ -374,40 +671,44 @@ async def start_training_endpoint(
             )
         dataset_id = payload.dataset_id
         layers = payload.layers
+        layer_payload = [layer.model_dump(exclude_none=True) for layer in layers]
     else:
         try:
             definition = _model_registry.get(model_id, db)
             dataset_id = payload.dataset_id or definition.dataset_id
-            layers = payload.layers or definition.layers
+            if payload.layers:
+                layers = payload.layers
+                layer_payload = None
+            else:
+                # Reuse the stored payload instead of dumping every layer again
+                layers = definition.layers
+                layer_payload = definition.layer_payload
         except ModelNotFoundError as exc:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Model '{model_id}' not found",
             ) from exc
 
-    try:
-        get_dataset(dataset_id)
-    except Exception as exc:
+    # Membership check only; the worker loads the actual data
+    if dataset_id not in available_datasets():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Dataset '{dataset_id}' not found",
-        ) from exc
+        )
 
     actual_model_id = model_id
     if model_id == "new":
-        import uuid
-
-        actual_model_id = f"temp-{uuid.uuid4()}"
-        # Persist temporary model config so FK constraint is satisfied
+        actual_model_id = f"temp-{uuid4().hex}"
+        # Temporary model config for the FK; start_training commits it together
+        # with the session row in one transaction
         db_model = ModelConfigDB(
             id=actual_model_id,
             name=f"Untitled ({dataset_id})",
             dataset_id=dataset_id,
-            layers=[layer.model_dump(exclude_none=True) for layer in layers],
+            layers=layer_payload,
             status="training",
         )
         db.add(db_model)
-        db.commit()
 
     try:
         session = _session_manager.start_training(
@@ -415,6 +716,7 @@ async def start_training_endpoint(
             dataset_id=dataset_id,
             layers=layers,
             db=db,
+            layer_payload=layer_payload,
             max_samples=payload.max_samples,
             epochs=payload.epochs,
             learning_rate=payload.learning_rate,
@@ -426,14 +728,24 @@ async def start_training_endpoint(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Model '{model_id}' is already running session '{exc.args[0]}'",
         ) from exc
+    except TrainingCapacityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"All {exc.args[0]} training workers are busy; retry once a session finishes",
+        ) from exc
 
-    return TrainingStartResponse(
-        session_id=session.session_id,
-        status=session.status,
-        total_epochs=session.total_epochs,
-        poll_interval_seconds=max(
-            DEFAULT_POLL_INTERVAL, 1.5 if session.status == "running" else 0.0
+    # Response fields come from engine state, so skip re-validating them here
+    # and in the stop/pause/resume responses
+    return _json_response(
+        TrainingStartResponse.model_construct(
+            session_id=session.session_id,
+            status=session.status,
+            total_epochs=session.total_epochs,
+            poll_interval_seconds=max(
+                DEFAULT_POLL_INTERVAL, 1.5 if session.status == "running" else 0.0
+            ),
         ),
+        status.HTTP_202_ACCEPTED,
     )
 
 
@@ -443,25 +755,40 @@ async def start_training_endpoint(
 )
 async def get_training_status_endpoint(
     session_id: str,
+    request: Request,
     since_epoch: int = Query(
         0, ge=0, description="Return metrics with epoch greater than this value"
     ),
+    wait: float = Query(
+        0.0,
+        ge=0.0,
+        le=MAX_LONG_POLL_SECONDS,
+        description="Hold the request open up to this many seconds until the session changes",
+    ),
+    since_status: Optional[str] = Query(
+        None, description="Last status seen by the client; used together with wait"
+    ),
     db: Session = Depends(get_db),
-) -> TrainingStatusResponse:
+) -> Response:
+    if wait > 0:
+        await _session_manager.wait_for_update(
+            session_id, since_status, since_epoch, wait
+        )
+
     try:
-        session = _session_manager.get_session(session_id, db)
+        session, job = _session_manager.get_session_and_job(session_id, db, since_epoch)
     except SessionNotFoundError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found"
         ) from exc
 
-    metrics = _build_metric_payloads(session.metrics, since_epoch)
     progress = _calculate_progress(session)
     poll_interval = (
         DEFAULT_POLL_INTERVAL if session.status in {"running", "paused"} else 5.0
     )
 
-    return TrainingStatusResponse(
+    # Every field comes from validated session state, so skip re-validation
+    body = TrainingStatusResponse.model_construct(
         session_id=session.session_id,
         model_id=session.model_id,
         dataset_id=session.dataset_id,
@@ -469,11 +796,55 @@ async def get_training_status_endpoint(
         current_epoch=session.current_epoch,
         total_epochs=session.total_epochs,
         progress=progress,
-        metrics=metrics,
+        metrics=[],
         error_message=session.error_message,
         started_at=session.start_time,
         completed_at=session.end_time,
         poll_interval_seconds=poll_interval,
+    ).model_dump_json(exclude={"metrics"})
+    # Recorded epochs never change, so the metric count and since_epoch stand in
+    # for the metrics; every other field is covered by hashing the body itself
+    digest = hashlib.blake2b(body.encode(), digest_size=8).hexdigest()
+    etag = f'W/"{len(session.metrics)}-{since_epoch}-{digest}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    # Splice in the cached per-epoch JSON instead of re-serializing every metric.
+    # Sessions read from the DB were already filtered to epochs past since_epoch.
+    unseen = _metric_json(session)
+    if job is not None:
+        unseen = unseen[since_epoch:]
+    metrics = ",".join(unseen)
+    return Response(
+        content=f'{body[:-1]},"metrics":[{metrics}]}}',
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.get("/training/{session_id}/stream")
+async def stream_training_endpoint(
+    session_id: str,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream training progress as server-sent events until the session ends."""
+    try:
+        session, job = _session_manager.get_session_and_job(session_id, db)
+    except SessionNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found"
+        ) from exc
+
+    # Historical sessions have no engine: replay stored metrics and the final status
+    engine = job.engine if job is not None else None
+
+    return StreamingResponse(
+        _stream_session_events(session, engine),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -485,16 +856,53 @@ async def predict_endpoint(
     session_id: str,
     request: PredictionRequest,
     db: Session = Depends(get_db),
-) -> PredictionResponse:
+) -> Response:
     """Run prediction using a trained model."""
+    job = _get_trained_job(session_id, db)
+
     try:
-        job = _session_manager.get_job(session_id)
-    except SessionNotFoundError as exc:
+        result = job.engine.predict(request.inputs)
+        return _json_response(PredictionResponse(**result))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prediction failed: {str(e)}",
+        )
+
+
+@router.post(
+    "/training/{session_id}/predict/batch",
+    response_model=BatchPredictionResponse,
+)
+async def predict_batch_endpoint(
+    session_id: str,
+    request: BatchPredictionRequest,
+    db: Session = Depends(get_db),
+) -> Response:
+    """Run prediction for many samples with a single forward pass."""
+    job = _get_trained_job(session_id, db)
+
+    try:
+        result = job.engine.predict_batch(request.inputs)
+        return _json_response(BatchPredictionResponse(**result))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prediction failed: {str(e)}",
+        )
+
+
+def _get_trained_job(session_id: str, db: Session) -> TrainingJob:
+    try:
+        session, job = _session_manager.get_session_and_job(session_id, db)
+    except SessionNotFoundError:
+        job = None
+    if job is None:
+        # Only in-memory jobs hold a trained model
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found"
-        ) from exc
+        )
 
-    session = _session_manager.get_session(session_id, db)
     if session.status not in ("completed", "stopped"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -505,15 +913,7 @@ async def predict_endpoint(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No trained model available"
         )
-
-    try:
-        result = job.engine.predict(request.inputs)
-        return PredictionResponse(**result)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Prediction failed: {str(e)}",
-        )
+    return job
 
 
 class StopTrainingResponse(BaseModel):
@@ -538,7 +938,7 @@ class ResumeTrainingResponse(BaseModel):
     "/training/{session_id}/stop",
     response_model=StopTrainingResponse,
 )
-async def stop_training_endpoint(session_id: str) -> StopTrainingResponse:
+async def stop_training_endpoint(session_id: str) -> Response:
     """Stop an ongoing training session."""
     try:
         session = _session_manager.stop_session(session_id)
@@ -548,16 +948,20 @@ async def stop_training_endpoint(session_id: str) -> StopTrainingResponse:
         ) from exc
 
     if session.status == "running":
-        return StopTrainingResponse(
-            session_id=session_id,
-            status="stopping",
-            message="Stop request sent. Training will stop after the current epoch.",
+        return _json_response(
+            StopTrainingResponse.model_construct(
+                session_id=session_id,
+                status="stopping",
+                message="Stop request sent. Training will stop after the current epoch.",
+            )
         )
     else:
-        return StopTrainingResponse(
-            session_id=session_id,
-            status=session.status,
-            message=f"Training already {session.status}",
+        return _json_response(
+            StopTrainingResponse.model_construct(
+                session_id=session_id,
+                status=session.status,
+                message=f"Training already {session.status}",
+            )
         )
 
 
@@ -565,7 +969,7 @@ async def stop_training_endpoint(session_id: str) -> StopTrainingResponse:
     "/training/{session_id}/pause",
     response_model=PauseTrainingResponse,
 )
-async def pause_training_endpoint(session_id: str) -> PauseTrainingResponse:
+async def pause_training_endpoint(session_id: str) -> Response:
     """Pause an ongoing training session."""
     try:
         session = _session_manager.pause_session(session_id)
@@ -574,12 +978,14 @@ async def pause_training_endpoint(session_id: str) -> PauseTrainingResponse:
             status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found"
         ) from exc
 
-    return PauseTrainingResponse(
-        session_id=session_id,
-        status=session.status,
-        message="Training paused"
-        if session.status == "paused"
-        else f"Training already {session.status}",
+    return _json_response(
+        PauseTrainingResponse.model_construct(
+            session_id=session_id,
+            status=session.status,
+            message="Training paused"
+            if session.status == "paused"
+            else f"Training already {session.status}",
+        )
     )
 
 
@@ -587,7 +993,7 @@ async def pause_training_endpoint(session_id: str) -> PauseTrainingResponse:
     "/training/{session_id}/resume",
     response_model=ResumeTrainingResponse,
 )
-async def resume_training_endpoint(session_id: str) -> ResumeTrainingResponse:
+async def resume_training_endpoint(session_id: str) -> Response:
     """Resume a paused training session."""
     try:
         session = _session_manager.resume_session(session_id)
@@ -596,12 +1002,14 @@ async def resume_training_endpoint(session_id: str) -> ResumeTrainingResponse:
             status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found"
         ) from exc
 
-    return ResumeTrainingResponse(
-        session_id=session_id,
-        status=session.status,
-        message="Training resumed"
-        if session.status == "running"
-        else f"Training already {session.status}",
+    return _json_response(
+        ResumeTrainingResponse.model_construct(
+            session_id=session_id,
+            status=session.status,
+            message="Training resumed"
+            if session.status == "running"
+            else f"Training already {session.status}",
+        )
     )
 
 
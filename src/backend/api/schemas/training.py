@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, PositiveInt, field_validator
+from pydantic import BaseModel, Field, PositiveInt, field_validator, model_validator
 
-_ALLOWED_ACTIVATIONS = {"relu", "sigmoid", "tanh", "softmax", "linear"}
+_ALLOWED_ACTIVATIONS = frozenset({"relu", "sigmoid", "tanh", "softmax", "linear"})
+_ALLOWED_ACTIVATIONS_SORTED = tuple(sorted(_ALLOWED_ACTIVATIONS))
 
 
 class LayerConfig(BaseModel):
@@ -28,13 +29,22 @@ class LayerConfig(BaseModel):
     def _normalize_activation(cls, value: Optional[str]) -> Optional[str]:
         if value is None:
             return None
+        # The builder UI already sends canonical lowercase names
+        if value in _ALLOWED_ACTIVATIONS:
+            return value
         normalized = value.strip().lower()
         if normalized not in _ALLOWED_ACTIVATIONS:
             raise ValueError(
-                f"Unsupported activation '{value}'. Allowed: {sorted(_ALLOWED_ACTIVATIONS)}"
+                f"Unsupported activation '{value}'. Allowed: {list(_ALLOWED_ACTIVATIONS_SORTED)}"
             )
         return normalized
 
+    @model_validator(mode="after")
+    def _reject_hidden_softmax(self) -> "LayerConfig":
+        if self.type == "hidden" and self.activation == "softmax":
+            raise ValueError("Softmax is only supported on the output layer")
+        return self
+
 
 class TrainingStartRequest(BaseModel):
     dataset_id: Optional[str] = Field(
@@ -1,5 +1,5 @@
 """Prebuilt MLP templates for all datasets."""
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 # Template data structure matching the API schema
 # Assumes teammate has created the Pydantic models
@@ -127,9 +127,30 @@ TEMPLATES: Dict[str, dict] = {
 }
 
 
-def list_all_templates() -> List[dict]:
+def _layer_shapes(template: dict) -> List[Tuple[int, int]]:
+    """Return (in_features, out_features) per Linear layer implied by template."""
+    neurons = [int(layer["neurons"]) for layer in template["layers"]]
+    return list(zip(neurons[:-1], neurons[1:]))
+
+
+# Templates are static, so their layer shapes are computed once at import
+TEMPLATE_SHAPES: Dict[str, List[Tuple[int, int]]] = {
+    template_id: _layer_shapes(template) for template_id, template in TEMPLATES.items()
+}
+
+
+# Static lookups built once: listing and per-dataset filtering return these
+# shared tuples instead of rebuilding lists on every call
+_ALL: Tuple[dict, ...] = tuple(TEMPLATES.values())
+_BY_DATASET: Dict[str, Tuple[dict, ...]] = {
+    dataset_id: tuple(t for t in _ALL if t["dataset_id"] == dataset_id)
+    for dataset_id in {t["dataset_id"] for t in _ALL}
+}
+
+
+def list_all_templates() -> Tuple[dict, ...]:
     """Return all available templates."""
-    return list(TEMPLATES.values())
+    return _ALL
 
 
 def get_template_by_id(template_id: str) -> dict:
@@ -137,6 +158,6 @@ def get_template_by_id(template_id: str) -> dict:
     return TEMPLATES.get(template_id)
 
 
-def filter_templates_by_dataset(dataset_id: str) -> List[dict]:
+def filter_templates_by_dataset(dataset_id: str) -> Tuple[dict, ...]:
     """Filter templates for a specific dataset."""
-    return [t for t in TEMPLATES.values() if t["dataset_id"] == dataset_id]
+    return _BY_DATASET.get(dataset_id, ())
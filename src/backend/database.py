@@ -1,23 +1,74 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from backend.api.core.config import settings
 
+_is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+
 # SQLite requires check_same_thread=False; other DBs do not support that arg
-_connect_args = (
-    {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-)
+_connect_args = {"check_same_thread": False} if _is_sqlite else {}
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args=_connect_args,
-    pool_pre_ping=not settings.DATABASE_URL.startswith("sqlite"),
+# Server databases: reuse warm connections (LIFO) and recycle them before
+# typical server/proxy idle timeouts. SQLite keeps SQLAlchemy's default pool.
+_server_pool_args = (
+    {}
+    if _is_sqlite
+    else {"pool_pre_ping": True, "pool_recycle": 1800, "pool_use_lifo": True}
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL lets readers run alongside the metric writer and, with
+    # synchronous=NORMAL, syncs at checkpoints instead of on every commit
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _create_engine(**kwargs) -> Engine:
+    new_engine = create_engine(settings.DATABASE_URL, **kwargs)
+    if _is_sqlite:
+        event.listen(new_engine, "connect", _sqlite_pragmas)
+    return new_engine
+
+
+if _is_sqlite:
+    engine = _create_engine(connect_args=_connect_args)
+else:
+    engine = _create_engine(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_OVERFLOW,
+        **_server_pool_args,
+    )
+
+# Request handlers build their responses from values they just wrote, so
+# don't expire them on commit (which forces a SELECT on the next access)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
 
+def training_sessionmaker(pool_size: int) -> sessionmaker:
+    """Sessions for training-completion writes on their own small pool.
+
+    Keeps bursts of finishing jobs from queueing behind request handlers
+    for a connection from the shared ``engine`` pool.
+    """
+    training_engine = _create_engine(
+        connect_args=_connect_args,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        **_server_pool_args,
+    )
+    return sessionmaker(autocommit=False, autoflush=False, bind=training_engine)
+
+
 def get_db():
     db = SessionLocal()
     try:
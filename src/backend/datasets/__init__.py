@@ -1,11 +1,6 @@
-# Ensure dataset classes register on import
-from . import california_housing  # noqa: F401
-from . import iris  # noqa: F401
-from . import mnist  # noqa: F401
-from . import synthetic  # noqa: F401
-from . import wine_quality  # noqa: F401
+# Dataset modules are imported lazily by get_dataset (see registry._DATASET_MODULES)
 from .base import BaseDataset, Hyperparameters
-from .registry import get_dataset, list_datasets, register_dataset
+from .registry import available_datasets, get_dataset, list_datasets, register_dataset
 
 __all__ = [
     "BaseDataset",
@@ -13,4 +8,5 @@ __all__ = [
     "register_dataset",
     "get_dataset",
     "list_datasets",
+    "available_datasets",
 ]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Type
 
 import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hyperparameters:
     epochs: int
     learning_rate: float
@@ -15,6 +19,101 @@ class Hyperparameters:
     optimizer: str = "adam"
 
 
+def _cache_dir() -> Path:
+    default = Path.home() / ".cache" / "nn-playground"
+    return Path(os.getenv("NN_PLAYGROUND_CACHE_DIR", default))
+
+
+def _save_npy(path: Path, array: np.ndarray) -> None:
+    # Write beside the target and rename so readers never see a partial file
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as fh:
+        np.save(fh, array)
+    os.replace(tmp_path, path)
+
+
+def cached_source_arrays(
+    name: str, fetch: Callable[[], Tuple[np.ndarray, np.ndarray]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a dataset's full (X, y) as read-only memory-mapped ``.npy`` files.
+
+    ``fetch`` runs only when the files are missing, so any normalization it
+    does is paid once; afterwards pages are read lazily from the OS cache.
+    """
+    directory = _cache_dir() / name
+    x_path, y_path = directory / "X.npy", directory / "y.npy"
+    if not (x_path.exists() and y_path.exists()):
+        X, y = fetch()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            _save_npy(x_path, X)
+            _save_npy(y_path, y)
+        except OSError:
+            # Unwritable cache dir: serve the fetched arrays for this process only
+            X.flags.writeable = False
+            y.flags.writeable = False
+            return X, y
+    return np.load(x_path, mmap_mode="r"), np.load(y_path, mmap_mode="r")
+
+
+class _Float32Scaler:
+    """Standardize features in float32, in place unless ``copy=True``.
+
+    Zero-variance features are left unscaled, matching StandardScaler.
+    """
+
+    def fit(self, X: np.ndarray) -> "_Float32Scaler":
+        # Accumulate in float64 for accuracy; the stored statistics are float32
+        self.mean_ = X.mean(axis=0, dtype=np.float64).astype(np.float32)
+        scale = X.std(axis=0, dtype=np.float64).astype(np.float32)
+        scale[scale == 0] = 1.0
+        self.scale_ = scale
+        return self
+
+    def transform(self, X: np.ndarray, copy: bool = False) -> np.ndarray:
+        # With copy=True the subtraction allocates the output, so the input is
+        # read once and never duplicated first
+        out = np.subtract(X, self.mean_, out=None if copy else X)
+        np.divide(out, self.scale_, out=out)
+        return out
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        return self.fit(X).transform(X)
+
+
+_PreparedKey = Tuple[Type["BaseDataset"], Tuple[Tuple[str, Any], ...], float]
+_Prepared = Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray], Any]
+
+_MAX_PREPARED = 8
+# Prepared splits in least-recently-used order (guarded by _prepared_lock). A
+# plain LRU instead of functools.lru_cache so callers can check for a hit
+# without triggering a load.
+_prepared: "OrderedDict[_PreparedKey, _Prepared]" = OrderedDict()
+_prepared_lock = threading.Lock()
+
+
+def _load_prepared(
+    cls: Type["BaseDataset"],
+    init_kwargs: Tuple[Tuple[str, Any], ...],
+    test_size: float,
+) -> _Prepared:
+    """Run ``_load()`` once per dataset configuration and keep the fitted scaler."""
+    key = (cls, init_kwargs, test_size)
+    with _prepared_lock:
+        if key in _prepared:
+            _prepared.move_to_end(key)
+            return _prepared[key]
+    # Load outside the lock; concurrent misses on one key both load, last one wins
+    dataset = cls(**dict(init_kwargs))
+    arrays = dataset._load(test_size=test_size)
+    prepared = (arrays, getattr(dataset, "scaler", None))
+    with _prepared_lock:
+        _prepared[key] = prepared
+        while len(_prepared) > _MAX_PREPARED:
+            _prepared.popitem(last=False)
+    return prepared
+
+
 class BaseDataset(ABC):
     """Abstract base class for curated datasets.
 
@@ -27,7 +126,7 @@ class BaseDataset(ABC):
     - num_classes: number of output classes (for classification) or 1 (for regression)
     - description: short description
     - hyperparameters: pre-configured Hyperparameters per charter
-    - load() implementation that returns preprocessed train/test splits
+    - _load() implementation that returns preprocessed train/test splits
     """
 
     id: str
@@ -45,15 +144,35 @@ class BaseDataset(ABC):
         self.max_samples = max_samples
         self.random_state = random_state
 
-    @abstractmethod
     def load(
         self, test_size: float = 0.2
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Load, preprocess, and split the dataset.
 
+        Results are memoized per dataset configuration, so the arrays are
+        shared between callers and must not be modified in place.
+
         Returns:
             X_train, y_train, X_test, y_test (all numpy arrays)
         """
+        arrays, scaler = _load_prepared(type(self), self._cache_key(), test_size)
+        if scaler is not None:
+            self.scaler = scaler
+        return arrays
+
+    def is_loaded(self, test_size: float = 0.2) -> bool:
+        """Whether ``load(test_size)`` would return memoized arrays without loading."""
+        return (type(self), self._cache_key(), test_size) in _prepared
+
+    @abstractmethod
+    def _load(
+        self, test_size: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Uncached ``load()``: fetch, preprocess, and split the dataset."""
+
+    def _cache_key(self) -> Tuple[Tuple[str, Any], ...]:
+        """Constructor kwargs that determine what ``_load()`` returns."""
+        return (("max_samples", self.max_samples), ("random_state", self.random_state))
 
     # Common helpers
     def _ensure_float32(self, array: np.ndarray) -> np.ndarray:
@@ -61,18 +180,45 @@ class BaseDataset(ABC):
             return array.astype(np.float32)
         return array
 
+    def _stratified_split(
+        self, X: np.ndarray, y: np.ndarray, test_size: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Shuffled split that keeps class proportions, like ``train_test_split``.
+
+        Returns X_train, X_test, y_train, y_test. A class with a single sample
+        goes to the training split.
+        """
+        rng = np.random.default_rng(self.random_state)
+        _, inverse, counts = np.unique(y, return_inverse=True, return_counts=True)
+        # Shuffle once, then stable-sort by class: samples end up grouped by
+        # class and still in random order within each group
+        order = rng.permutation(len(y))
+        order = order[np.argsort(inverse[order], kind="stable")]
+        n_test = np.minimum(np.rint(counts * test_size).astype(np.int64), counts - 1)
+        starts = np.cumsum(counts) - counts
+        rank = np.arange(len(y)) - np.repeat(starts, counts)
+        is_test = rank < np.repeat(n_test, counts)
+        train_idx = rng.permutation(order[~is_test])
+        test_idx = rng.permutation(order[is_test])
+        return X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+
     def _validate_no_nans(self, *arrays: np.ndarray) -> None:
+        # Cheap sanity check rather than a contract: any NaN propagates through
+        # the sum, so one reduction pass replaces a full-size boolean mask
         for arr in arrays:
-            if np.isnan(arr).any():
+            if not np.isfinite(arr.sum()):
                 raise ValueError("NaN values detected after preprocessing.")
 
     def transform_inputs(self, inputs) -> np.ndarray:
         """Transform raw user inputs to match training preprocessing.
 
-        Default behavior returns float32 numpy array shaped (1, num_features).
-        Datasets that fit scalers should override/extend this to reuse them.
+        Returns a float32 numpy array shaped (n, num_features), standardized
+        with the scaler fitted in ``load()`` when the dataset has one.
         """
         arr = np.asarray(inputs, dtype=np.float32)
         if arr.ndim == 1:
             arr = arr.reshape(1, -1)
-        return self._ensure_float32(arr)
+        scaler = getattr(self, "scaler", None)
+        if scaler is not None:
+            arr = scaler.transform(arr, copy=True)
+        return arr
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
 from sklearn.datasets import fetch_california_housing
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
-from .base import BaseDataset, Hyperparameters
+from .base import BaseDataset, Hyperparameters, _Float32Scaler, cached_source_arrays
 from .registry import register_dataset
 
 
+def _fetch() -> Tuple[np.ndarray, np.ndarray]:
+    bunch = fetch_california_housing(as_frame=False)
+    X: np.ndarray = bunch.data
+    y: np.ndarray = bunch.target.astype(np.float32)
+    return X, y
+
+
+@lru_cache(maxsize=1)
+def _load_source() -> Tuple[np.ndarray, np.ndarray]:
+    """Full dataset, memory-mapped from disk after the first fetch."""
+    return cached_source_arrays("california_housing", _fetch)
+
+
 @register_dataset("california_housing")
 class CaliforniaHousingDataset(BaseDataset):
     name = "California Housing"
@@ -21,35 +34,27 @@ class CaliforniaHousingDataset(BaseDataset):
     description = "Predict median house values from 8 numeric features (regression)."
     hyperparameters = Hyperparameters(epochs=20, learning_rate=0.001, batch_size=512)
 
-    def load(
+    def _load(
         self, test_size: float = 0.2
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        bunch = fetch_california_housing(as_frame=False)
-        X: np.ndarray = bunch.data
-        y: np.ndarray = bunch.target.astype(np.float32)
+        X, y = _load_source()
 
         if self.max_samples is not None and self.max_samples < len(X):
             X = X[: self.max_samples]
             y = y[: self.max_samples]
+        # Cast before splitting so every later copy is already float32
+        X = self._ensure_float32(X)
 
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=test_size, random_state=self.random_state
         )
 
-        self.scaler = StandardScaler()
+        # The splits are fresh float32 copies, so scale them in place
+        self.scaler = _Float32Scaler()
         X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
-
-        X_train = self._ensure_float32(X_train)
-        X_test = self._ensure_float32(X_test)
-        y_train = y_train.astype(np.float32)
-        y_test = y_test.astype(np.float32)
+        y_train = y_train.astype(np.float32, copy=False)
+        y_test = y_test.astype(np.float32, copy=False)
 
         self._validate_no_nans(X_train, X_test)
         return X_train, y_train, X_test, y_test
-
-    def transform_inputs(self, inputs):
-        arr = super().transform_inputs(inputs)
-        if getattr(self, "scaler", None) is not None:
-            arr = self.scaler.transform(arr)
-        return self._ensure_float32(arr)
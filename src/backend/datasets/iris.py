@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import base64
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
-from sklearn.datasets import load_iris
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
-from .base import BaseDataset, Hyperparameters
+from .base import BaseDataset, Hyperparameters, _Float32Scaler
 from .registry import register_dataset
 
+# The canonical 150x4 Iris measurements (as in sklearn.datasets.load_iris),
+# stored as uint8 tenths of a centimetre; rows are ordered by class, 50 each
+_IRIS_TENTHS = (
+    "MyMOAjEeDgIvIA0CLh8PAjIkDgI2JxEELiIOAzIiDwIsHQ4CMR8PATYlDwIwIhACMB4OASseCwE6"
+    "KAwCOSwPBDYnDQQzIw4DOSYRAzMmDwM2IhECMyUPBC4kCgIzIREFMCITAjIeEAIyIhAENCMPAjQi"
+    "DgIvIBACMB8QAjYiDwQ0KQ8BNyoOAjEfDwIyIAwCNyMNAjEkDgEsHg0CMyIPAjIjDQMtFw0DLCAN"
+    "AjIjEAYzJhMEMB4OAzMmEAIuIA4CNSUPAjIhDgJGIC8OQCAtD0UfMQ83FygNQRwuDzkcLQ0/IS8Q"
+    "MRghCkIdLg00GycOMhQjCjseKg88FigKPR0vDjgdJA1DHywOOB4tDzobKQo+Fi0POBknCzsgMBI9"
+    "HCgNPxkxDz0cLwxAHSsNQh4sDkQcMA5DHjIRPB0tDzkaIwo3GCYLNxglCjobJww8GzMQNh4tDzwi"
+    "LRBDHy8PPxcsDTgeKQ03GSgNNxosDD0eLg46GigMMhchCjgbKg05HioMOR0qDT4dKw0zGR4LORwp"
+    "DT8hPBk6GzMTRx47FT8dOBJBHjoWTB5CFTEZLRFJHT8SQxk6EkgkPRlBIDMUQBs1E0QeNxU5GTIU"
+    "OhwzGEAgNRdBHjcSTSZDFk0aRRc8FjIPRSA5FzgcMRRNHEMUPxsxEkMhORVIIDwSPhwwEj0eMRJA"
+    "HDgVSB46EEocPRNPJkAUQBw4Fj8cMw89GjgOTR49Fz8iOBhAHzcSPB4wEkUfNhVDHzgYRR8zFzob"
+    "MxNEIDsXQyE5GUMeNBc/GTITQR40FD4iNhc7HjMS"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_source() -> Tuple[np.ndarray, np.ndarray]:
+    """Decode the embedded dataset once per process (arrays are read-only)."""
+    tenths = np.frombuffer(base64.b64decode(_IRIS_TENTHS), dtype=np.uint8)
+    X: np.ndarray = tenths.reshape(150, 4) / 10.0
+    y: np.ndarray = np.repeat(np.arange(3, dtype=np.int64), 50)
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y
+
 
 @register_dataset("iris")
 class IrisDataset(BaseDataset):
@@ -21,33 +47,23 @@ class IrisDataset(BaseDataset):
     description = "Simple 3-class classification on flower measurements (4 features)."
     hyperparameters = Hyperparameters(epochs=50, learning_rate=0.01, batch_size=32)
 
-    def load(
+    def _load(
         self, test_size: float = 0.2
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        bunch = load_iris(as_frame=False)
-        X: np.ndarray = bunch.data
-        y: np.ndarray = bunch.target.astype(np.int64)
+        X, y = _load_source()
 
         if self.max_samples is not None and self.max_samples < len(X):
             X = X[: self.max_samples]
             y = y[: self.max_samples]
+        # Cast before splitting so every later copy is already float32
+        X = self._ensure_float32(X)
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=self.random_state, stratify=y
-        )
+        X_train, X_test, y_train, y_test = self._stratified_split(X, y, test_size)
 
-        self.scaler = StandardScaler()
+        # The splits are fresh float32 copies, so scale them in place
+        self.scaler = _Float32Scaler()
         X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
 
-        X_train = self._ensure_float32(X_train)
-        X_test = self._ensure_float32(X_test)
-
         self._validate_no_nans(X_train, X_test)
         return X_train, y_train, X_test, y_test
-
-    def transform_inputs(self, inputs):
-        arr = super().transform_inputs(inputs)
-        if getattr(self, "scaler", None) is not None:
-            arr = self.scaler.transform(arr)
-        return self._ensure_float32(arr)
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Type
+import importlib
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Type
 
 from .base import BaseDataset
 
 _DATASET_REGISTRY: Dict[str, Type[BaseDataset]] = {}
 
+# Built-in dataset modules, imported on first use so that starting the API
+# does not pull in sklearn/pandas. Each module registers its class on import.
+_DATASET_MODULES: Dict[str, str] = {
+    "california_housing": "california_housing",
+    "iris": "iris",
+    "mnist": "mnist",
+    "synthetic": "synthetic",
+    "wine_quality": "wine_quality",
+}
+
 
 def register_dataset(
     dataset_id: str,
@@ -17,20 +29,30 @@ def register_dataset(
             raise KeyError(f"Dataset id '{dataset_id}' already registered")
         _DATASET_REGISTRY[dataset_id] = cls
         cls.id = dataset_id  # type: ignore[attr-defined]
+        available_datasets.cache_clear()
         return cls
 
     return _decorator
 
 
 def get_dataset(dataset_id: str, **kwargs) -> BaseDataset:
+    if dataset_id not in _DATASET_REGISTRY and dataset_id in _DATASET_MODULES:
+        importlib.import_module(f"{__package__}.{_DATASET_MODULES[dataset_id]}")
     try:
         cls = _DATASET_REGISTRY[dataset_id]
     except KeyError as exc:
         raise KeyError(
-            f"Unknown dataset_id '{dataset_id}'. Available: {sorted(_DATASET_REGISTRY.keys())}"
+            f"Unknown dataset_id '{dataset_id}'. Available: {list_datasets()}"
         ) from exc
     return cls(**kwargs)
 
 
 def list_datasets() -> List[str]:
-    return sorted(_DATASET_REGISTRY.keys())
+    """Ids of all datasets, without importing the modules that define them."""
+    return sorted(_DATASET_MODULES.keys() | _DATASET_REGISTRY.keys())
+
+
+@lru_cache(maxsize=1)
+def available_datasets() -> FrozenSet[str]:
+    """Ids of all datasets as a set for membership checks; rebuilt on registration."""
+    return frozenset(list_datasets())
@@ -3,17 +3,18 @@ from __future__ import annotations
 from typing import Literal, Tuple
 
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
-from .base import BaseDataset, Hyperparameters
+from .base import BaseDataset, Hyperparameters, _Float32Scaler
 from .registry import register_dataset
 
 
 def _make_xor(n_samples: int, random_state: int) -> Tuple[np.ndarray, np.ndarray]:
     rng = np.random.default_rng(random_state)
-    X = rng.uniform(-1.0, 1.0, size=(n_samples, 2)).astype(np.float32)
-    y = ((X[:, 0] > 0) ^ (X[:, 1] > 0)).astype(np.int64)
+    # Draw float32 directly and rescale [0, 1) -> [-1, 1) in place
+    X = rng.random(size=(n_samples, 2), dtype=np.float32)
+    X *= 2.0
+    X -= 1.0
+    y = np.not_equal(X[:, 0] > 0, X[:, 1] > 0).astype(np.int64)
     return X, y
 
 
@@ -23,14 +24,17 @@ def _make_spiral(n_samples: int, random_state: int) -> Tuple[np.ndarray, np.ndar
     theta = rng.uniform(0, 4 * np.pi, size=n_per_class)
     r = np.linspace(0.0, 1.0, n_per_class, dtype=np.float32)
 
-    x1 = np.stack([r * np.cos(theta), r * np.sin(theta)], axis=1)
-    x2 = np.stack([r * np.cos(theta + np.pi), r * np.sin(theta + np.pi)], axis=1)
-    X = np.concatenate([x1, x2], axis=0).astype(np.float32)
-    y = np.concatenate(
-        [np.zeros(n_per_class, dtype=np.int64), np.ones(n_per_class, dtype=np.int64)]
-    )
+    # Fill both arms in one preallocated buffer; the second arm is the first
+    # rotated by pi, i.e. cos(t + pi) = -cos(t) and sin(t + pi) = -sin(t)
+    X = np.empty((2 * n_per_class, 2), dtype=np.float32)
+    np.multiply(r, np.cos(theta), out=X[:n_per_class, 0], casting="same_kind")
+    np.multiply(r, np.sin(theta), out=X[:n_per_class, 1], casting="same_kind")
+    np.negative(X[:n_per_class], out=X[n_per_class:])
+    y = np.repeat(np.arange(2, dtype=np.int64), n_per_class)
     # Add small noise
-    X += rng.normal(0, 0.05, size=X.shape).astype(np.float32)
+    noise = rng.standard_normal(size=X.shape, dtype=np.float32)
+    noise *= 0.05
+    X += noise
     return X, y
 
 
@@ -48,7 +52,10 @@ class SyntheticDataset(BaseDataset):
         super().__init__(**kwargs)
         self.kind: Literal["xor", "spiral"] = kind
 
-    def load(
+    def _cache_key(self):
+        return super()._cache_key() + (("kind", self.kind),)
+
+    def _load(
         self, test_size: float = 0.2
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         n_samples = (
@@ -62,21 +69,11 @@ class SyntheticDataset(BaseDataset):
         else:
             X, y = _make_spiral(n_samples, self.random_state)
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=self.random_state, stratify=y
-        )
+        X_train, X_test, y_train, y_test = self._stratified_split(X, y, test_size)
 
-        self.scaler = StandardScaler()
+        # The splits are fresh float32 copies, so scale them in place
+        self.scaler = _Float32Scaler()
         X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
-
-        X_train = self._ensure_float32(X_train)
-        X_test = self._ensure_float32(X_test)
         self._validate_no_nans(X_train, X_test)
         return X_train, y_train, X_test, y_test
-
-    def transform_inputs(self, inputs):
-        arr = super().transform_inputs(inputs)
-        if getattr(self, "scaler", None) is not None:
-            arr = self.scaler.transform(arr)
-        return self._ensure_float32(arr)
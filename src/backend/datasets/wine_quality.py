@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
 from sklearn.datasets import fetch_openml
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
-from .base import BaseDataset, Hyperparameters
+from .base import BaseDataset, Hyperparameters, _Float32Scaler, cached_source_arrays
 from .registry import register_dataset
 
 
+def _fetch() -> Tuple[np.ndarray, np.ndarray]:
+    # OpenML dataset: wine-quality-red (ID/name)
+    # Plain numpy via the liac-arff parser: no DataFrame is built and pandas
+    # is not imported
+    data = fetch_openml(
+        name="wine-quality-red", version=1, as_frame=False, parser="liac-arff"
+    )
+    X = data.data.astype(np.float32, copy=False)
+    # Classes are integer-like strings; cast to int64
+    y = np.asarray(data.target).astype(np.int64)
+    return X, y
+
+
+@lru_cache(maxsize=1)
+def _load_source() -> Tuple[np.ndarray, np.ndarray]:
+    """Full dataset, memory-mapped from disk after the first fetch."""
+    return cached_source_arrays("wine_quality", _fetch)
+
+
 @register_dataset("wine_quality")
 class WineQualityDataset(BaseDataset):
     name = "Wine Quality (Red)"
@@ -21,37 +39,23 @@ class WineQualityDataset(BaseDataset):
     description = "Multi-class quality prediction on red wine (11 numeric features)."
     hyperparameters = Hyperparameters(epochs=30, learning_rate=0.001, batch_size=128)
 
-    def load(
+    def _load(
         self, test_size: float = 0.2
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        # OpenML dataset: wine-quality-red (ID/name)
-        data = fetch_openml(name="wine-quality-red", version=1, as_frame=True)
-        X = data.data.to_numpy(dtype=np.float32)
-        y = data.target.to_numpy()
-
-        # Classes are integer-like strings; cast to int64
-        y = y.astype(np.int64)
+        X, y = _load_source()
 
         if self.max_samples is not None and self.max_samples < len(X):
             X = X[: self.max_samples]
             y = y[: self.max_samples]
+        # Cast before splitting so every later copy is already float32
+        X = self._ensure_float32(X)
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=self.random_state, stratify=y
-        )
+        X_train, X_test, y_train, y_test = self._stratified_split(X, y, test_size)
 
-        self.scaler = StandardScaler()
+        # The splits are fresh float32 copies, so scale them in place
+        self.scaler = _Float32Scaler()
         X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
 
-        X_train = self._ensure_float32(X_train)
-        X_test = self._ensure_float32(X_test)
-
         self._validate_no_nans(X_train, X_test)
         return X_train, y_train, X_test, y_test
-
-    def transform_inputs(self, inputs):
-        arr = super().transform_inputs(inputs)
-        if getattr(self, "scaler", None) is not None:
-            arr = self.scaler.transform(arr)
-        return self._ensure_float32(arr)
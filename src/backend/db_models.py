@@ -1,7 +1,17 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
@@ -48,6 +58,10 @@ class TrainingSessionDB(Base):
 
 class TrainingMetricsDB(Base):
     __tablename__ = "training_metrics"
+    # Metric reads filter by session and order/filter by epoch
+    __table_args__ = (
+        Index("ix_training_metrics_session_epoch", "session_id", "epoch"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(
@@ -178,6 +178,11 @@ class DynamicMLPModel(nn.Module):
                     "All intermediate layers must be of type 'hidden'. "
                     f"Layer at index {idx} is '{layer.type}'."
                 )
+            if layer.activation == "softmax":
+                raise ModelConfigError(
+                    "Softmax is only supported on the output layer. "
+                    f"Layer at index {idx} is a hidden layer."
+                )
 
         if first.neurons != input_dim:
             raise ModelConfigError(
@@ -259,8 +264,6 @@ class DynamicMLPModel(nn.Module):
                 modules.append(nn.Sigmoid())
             elif activation == "tanh":
                 modules.append(nn.Tanh())
-            elif activation == "softmax":
-                modules.append(nn.Softmax(dim=1))
             else:
                 # Should not happen due to validation, but keep defensive.
                 raise ModelConfigError(
@@ -1,18 +1,36 @@
+import logging
 import math
 import threading
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 from torch import nn, optim
-from torch.utils.data import DataLoader, TensorDataset
 
 from backend.datasets import get_dataset
 from backend.models.dynamic_model import DynamicMLPModel
 from backend.training.models import TrainingMetric, TrainingSession
 
+logger = logging.getLogger(__name__)
+
+# bf16 autocast only pays for itself once the GEMMs are large; on small
+# batches the casts cost more than the faster matmuls save
+_BF16_MIN_BATCH_SIZE = 1024
+
+
+def _bf16_supported(device: torch.device) -> bool:
+    if device.type == "cuda":
+        return torch.cuda.is_bf16_supported()
+    if device.type == "cpu":
+        # Without native bf16 (AVX512-BF16/AMX) oneDNN emulates it, which is slower
+        try:
+            return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+        except (AttributeError, RuntimeError):
+            return False
+    return False
+
 
 class TrainingEngine:
     def __init__(
@@ -24,15 +42,19 @@ class TrainingEngine:
         learning_rate: Optional[float] = None,
         batch_size: Optional[int] = None,
         optimizer: Optional[str] = None,
+        max_samples: Optional[int] = None,
     ):
         self.dataset_id = dataset_id
         self.model_config = model_config
         self.device = torch.device(device)
-        self.session = None
+        # Set once a session is assigned so callers can wait without polling
+        self._session_ready = threading.Event()
+        self._session: Optional[TrainingSession] = None
         self.custom_epochs = epochs
         self.custom_lr = learning_rate
         self.custom_batch_size = batch_size
         self.custom_optimizer = optimizer
+        self.max_samples = max_samples
         # Store the trained model and task info for predictions
         self.trained_model = None
         self.task_type = None
@@ -43,6 +65,40 @@ class TrainingEngine:
         self._pause_requested = False
         self._pause_event = threading.Event()
         self._pause_event.set()
+        # Callbacks fired whenever the session changes (new epoch, status transition)
+        self._update_listeners: List[Callable[[], None]] = []
+
+    @property
+    def session(self) -> Optional[TrainingSession]:
+        return self._session
+
+    @session.setter
+    def session(self, value: Optional[TrainingSession]) -> None:
+        self._session = value
+        if value is not None:
+            self._session_ready.set()
+
+    def wait_for_session(self, timeout: float) -> Optional[TrainingSession]:
+        """Block until train() has created the session; None on timeout."""
+        if not self._session_ready.wait(timeout):
+            return None
+        return self._session
+
+    def add_update_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked whenever the training session changes."""
+        self._update_listeners.append(callback)
+
+    def remove_update_listener(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback previously passed to add_update_listener."""
+        try:
+            self._update_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_update(self) -> None:
+        # Iterate a copy: listeners may be removed from request threads meanwhile
+        for callback in list(self._update_listeners):
+            callback()
 
     def request_stop(self) -> None:
         """Request the training loop to stop at the next epoch."""
@@ -61,9 +117,9 @@ class TrainingEngine:
         self._pause_event.set()
 
     def _prepare_data(
-        self, max_samples: Optional[int] = None
+        self,
     ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
-        ds = get_dataset(self.dataset_id, max_samples=max_samples)
+        ds = get_dataset(self.dataset_id, max_samples=self.max_samples)
         X_train, y_train, X_test, y_test = ds.load(test_size=0.2)
         # Keep dataset instance so we can reuse preprocessing (e.g., scalers) during predict
         self.dataset = ds
@@ -75,42 +131,73 @@ class TrainingEngine:
         else:
             y_train_t = torch.from_numpy(np.asarray(y_train)).float().unsqueeze(1)
             y_test_t = torch.from_numpy(np.asarray(y_test)).float().unsqueeze(1)
-        return X_train_t, y_train_t, X_test_t, y_test_t, ds
+        # Move everything to the device once; batches are sliced on-device
+        return (
+            X_train_t.to(self.device),
+            y_train_t.to(self.device),
+            X_test_t.to(self.device),
+            y_test_t.to(self.device),
+            ds,
+        )
 
     def _select_loss(self, task_type: str):
         if task_type == "classification":
             return nn.CrossEntropyLoss()
         return nn.MSELoss()
 
+    @staticmethod
+    def _iter_batches(
+        X: torch.Tensor, y: torch.Tensor, batch_size: int, shuffle: bool = True
+    ) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        # Mini-batches by index: one gather per batch instead of
+        # DataLoader's per-sample __getitem__ and collate
+        num_samples = X.size(0)
+        if shuffle:
+            order = torch.randperm(num_samples, device=X.device)
+        else:
+            order = torch.arange(num_samples, device=X.device)
+        for batch_idx in order.split(batch_size):
+            yield X[batch_idx], y[batch_idx]
+
     def _train_one_epoch(
-        self, loader: DataLoader, model: nn.Module, optimizer, loss_fn, task_type: str
+        self,
+        X: torch.Tensor,
+        y: torch.Tensor,
+        batch_size: int,
+        model: nn.Module,
+        optimizer,
+        loss_fn,
+        task_type: str,
+        use_bf16: bool = False,
     ) -> Tuple[float, Optional[float]]:
         model.train()
-        running_loss = 0.0
-        correct = 0
-        total = 0
-        for Xb, yb in loader:
-            Xb = Xb.to(self.device)
-            yb = yb.to(self.device)
+        # Accumulate on the device and read back once per epoch; a per-batch
+        # .item() would force a device sync on every step
+        running_loss = torch.zeros((), device=X.device)
+        correct = torch.zeros((), device=X.device, dtype=torch.long)
+        num_samples = X.size(0)
+        for Xb, yb in self._iter_batches(X, y, batch_size):
             optimizer.zero_grad()
-            preds = model(Xb)
+            with torch.autocast(
+                device_type=X.device.type, dtype=torch.bfloat16, enabled=use_bf16
+            ):
+                preds = model(Xb)
+            # Loss and its gradient stay in float32
+            preds = preds.float()
 
             # Ensure shapes match for regression
             if task_type != "classification":
                 preds = preds.view_as(yb)
 
+            # NaN is caught once per epoch by _check_for_failures on the average
             loss = loss_fn(preds, yb)
-            if torch.isnan(loss).any():
-                raise ValueError("NaN loss")
             loss.backward()
             optimizer.step()
-            running_loss += loss.item() * Xb.size(0)
+            running_loss += loss.detach() * Xb.size(0)
             if task_type == "classification":
-                pred_classes = preds.argmax(dim=1)
-                correct += (pred_classes == yb).sum().item()
-                total += yb.size(0)
-        avg_loss = running_loss / len(loader.dataset)
-        acc = (correct / total) if task_type == "classification" else None
+                correct += (preds.argmax(dim=1) == yb).sum()
+        avg_loss = running_loss.item() / num_samples
+        acc = (correct.item() / num_samples) if task_type == "classification" else None
         return avg_loss, acc
 
     def _check_for_failures(self, loss: float) -> Optional[str]:
@@ -124,7 +211,7 @@ class TrainingEngine:
         # If custom epochs provided, use them. Otherwise default to 0 and let it update later (or peek dataset)
         initial_epochs = self.custom_epochs if self.custom_epochs is not None else 0
 
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         start_time = datetime.utcnow()
         self.session = TrainingSession(
             session_id=session_id,
@@ -134,6 +221,7 @@ class TrainingEngine:
             start_time=start_time,
             total_epochs=initial_epochs,
         )
+        self._notify_update()
         try:
             X_train, y_train, X_test, y_test, ds = self._prepare_data()
             hp = ds.hyperparameters
@@ -150,9 +238,6 @@ class TrainingEngine:
 
             self.session.total_epochs = epochs
 
-            train_ds = TensorDataset(X_train, y_train)
-            loader = DataLoader(train_ds, batch_size=batch_size, shuffle=True)
-
             # Build config for teammate's DynamicMLPModel
             # Extract output_dim from last layer in config
             layers = self.model_config["layers"]
@@ -177,12 +262,21 @@ class TrainingEngine:
             else:
                 optimizer = optim.Adam(model.parameters(), lr=lr)
 
-            print(
-                f"[training] session={session_id} model={model_id} dataset={self.dataset_id} "
-                f"epochs={epochs} lr={lr} batch_size={batch_size} optimizer={opt_name}"
+            logger.info(
+                "session=%s model=%s dataset=%s epochs=%s lr=%s batch_size=%s optimizer=%s",
+                session_id,
+                model_id,
+                self.dataset_id,
+                epochs,
+                lr,
+                batch_size,
+                opt_name,
             )
 
             loss_fn = self._select_loss(ds.task_type)
+            use_bf16 = batch_size >= _BF16_MIN_BATCH_SIZE and _bf16_supported(
+                self.device
+            )
 
             for epoch in range(1, epochs + 1):
                 # Check if stop was requested
@@ -193,26 +287,38 @@ class TrainingEngine:
 
                 self.session.current_epoch = epoch
                 avg_loss, acc = self._train_one_epoch(
-                    loader, model, optimizer, loss_fn, ds.task_type
+                    X_train,
+                    y_train,
+                    batch_size,
+                    model,
+                    optimizer,
+                    loss_fn,
+                    ds.task_type,
+                    use_bf16=use_bf16,
                 )
 
+                # Check before recording so a NaN loss never reaches the metrics
+                err = self._check_for_failures(avg_loss)
+                if err:
+                    self.session.status = "failed"
+                    self.session.error_message = err
+                    break
+
                 metric = TrainingMetric(
                     epoch=epoch,
                     loss=float(avg_loss),
                     accuracy=(float(acc) if acc is not None else None),
                     timestamp=datetime.utcnow(),
                 )
+                # One metric per epoch, in order: API readers rely on
+                # metrics[i].epoch == i + 1 to slice out unseen epochs
                 self.session.metrics.append(metric)
-
-                err = self._check_for_failures(avg_loss)
-                if err:
-                    self.session.status = "failed"
-                    self.session.error_message = err
-                    break
+                self._notify_update()
 
                 # Handle pause requests after completing an epoch
                 if self._pause_requested:
                     self.session.status = "paused"
+                    self._notify_update()
                     while self._pause_requested and not self._stop_requested:
                         self._pause_event.wait(timeout=0.25)
                     if self._stop_requested:
@@ -220,6 +326,7 @@ class TrainingEngine:
                         self.session.error_message = "Training stopped by user"
                         break
                     self.session.status = "running"
+                    self._notify_update()
             else:
                 self.session.status = "completed"
                 # Store the trained model for predictions
@@ -230,10 +337,22 @@ class TrainingEngine:
             self.session.error_message = str(e)
         finally:
             self.session.end_time = datetime.utcnow()
+            self._notify_update()
         return self.session
 
-    def predict(self, inputs: List[float]) -> Dict[str, Any]:
+    def predict(self, inputs: Union[List[float], np.ndarray]) -> Dict[str, Any]:
         """Run prediction on trained model."""
+        batch = self.predict_batch(inputs)
+        result = {"prediction": batch["predictions"][0]}
+        if "probabilities" in batch:
+            result["probabilities"] = batch["probabilities"][0]
+            result["confidence"] = batch["confidences"][0]
+        return result
+
+    def predict_batch(
+        self, inputs: Union[List[List[float]], np.ndarray]
+    ) -> Dict[str, Any]:
+        """Run one forward pass over a (batch, features) array of samples."""
         if self.trained_model is None:
             raise ValueError("Model has not been trained yet")
         if self.dataset is None:
@@ -244,28 +363,30 @@ class TrainingEngine:
         if hasattr(self.dataset, "transform_inputs"):
             processed_inputs = self.dataset.transform_inputs(inputs)
         else:
-            processed_inputs = np.asarray(inputs, dtype=np.float32).reshape(1, -1)
+            processed_inputs = np.asarray(inputs, dtype=np.float32)
+            if processed_inputs.ndim == 1:
+                processed_inputs = processed_inputs.reshape(1, -1)
 
-        input_tensor = torch.tensor(processed_inputs, dtype=torch.float32).to(
-            self.device
+        # processed_inputs is already float32, so this avoids an extra copy on CPU
+        input_tensor = torch.as_tensor(
+            processed_inputs, dtype=torch.float32, device=self.device
         )
-        with torch.no_grad():
+        # The trained model is never updated again, so skip autograd tracking
+        # entirely rather than just disabling gradients
+        with torch.inference_mode():
             output = self.trained_model(input_tensor)
 
             if self.task_type == "classification":
                 # Apply softmax to get probabilities
-                probabilities = torch.softmax(output, dim=1)[0].cpu().numpy().tolist()
-                predicted_class = int(torch.argmax(output, dim=1).item())
-                confidence = float(probabilities[predicted_class])
-
+                probabilities = torch.softmax(output, dim=1)
+                confidences, predicted = probabilities.max(dim=1)
                 return {
-                    "prediction": predicted_class,
-                    "probabilities": probabilities,
-                    "confidence": confidence,
+                    "predictions": predicted.cpu().tolist(),
+                    "probabilities": probabilities.cpu().tolist(),
+                    "confidences": confidences.cpu().tolist(),
                 }
             else:
                 # Regression
-                prediction = float(output[0].item())
                 return {
-                    "prediction": prediction,
+                    "predictions": output[:, 0].cpu().tolist(),
                 }
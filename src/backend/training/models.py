@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class TrainingMetric(BaseModel):
@@ -22,3 +22,5 @@ class TrainingSession(BaseModel):
     current_epoch: int = 0
     metrics: List[TrainingMetric] = []
     error_message: Optional[str] = None
+    # JSON of metrics[i], filled lazily by the API so each epoch is encoded once
+    _metric_json: List[str] = PrivateAttr(default_factory=list)
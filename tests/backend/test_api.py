@@ -80,6 +80,20 @@ class TestTemplateEndpoints:
         response = client.get("/api/templates/nonexistent_template")
         assert response.status_code == 404
 
+    def test_template_revalidation_returns_304(self):
+        response = client.get("/api/templates/mnist_simple")
+        etag = response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+        cached = client.get(
+            "/api/templates/mnist_simple", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        other = client.get("/api/templates/mnist_deep", headers={"If-None-Match": etag})
+        assert other.status_code == 200
+
 
 class TestRootEndpoints:
     def test_root_endpoint(self):
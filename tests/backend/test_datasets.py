@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import math
+import subprocess
+import sys
+from pathlib import Path
 
 import numpy as np
 import pytest
 
 from backend.datasets import get_dataset
+from backend.datasets.base import cached_source_arrays
 
 
 @pytest.mark.parametrize(
@@ -95,3 +99,92 @@ def test_registry_lists_all() -> None:
     available = set(list_datasets())
     expected = {"mnist", "iris", "california_housing", "wine_quality", "synthetic"}
     assert expected.issubset(available)
+
+
+def test_available_datasets_tracks_runtime_registration(monkeypatch) -> None:
+    from backend.datasets import (
+        BaseDataset,
+        available_datasets,
+        register_dataset,
+        registry,
+    )
+
+    assert "iris" in available_datasets()
+    monkeypatch.setattr(registry, "_DATASET_REGISTRY", dict(registry._DATASET_REGISTRY))
+    register_dataset("runtime_only")(type("RuntimeOnly", (BaseDataset,), {}))
+    try:
+        assert "runtime_only" in available_datasets()
+    finally:
+        monkeypatch.undo()
+        available_datasets.cache_clear()
+    assert "runtime_only" not in available_datasets()
+
+
+def test_load_is_memoized_per_configuration() -> None:
+    first = get_dataset("synthetic", kind="spiral", max_samples=200)
+    second = get_dataset("synthetic", kind="spiral", max_samples=200)
+
+    assert not first.is_loaded()
+    assert first.load()[0] is second.load()[0]
+    assert second.is_loaded()
+    assert not second.is_loaded(test_size=0.3)
+    # Each instance gets the scaler fitted on the shared split
+    assert second.scaler is first.scaler
+    xor = get_dataset("synthetic", kind="xor", max_samples=200)
+    assert xor.load()[0] is not first.load()[0]
+
+
+def test_source_arrays_are_fetched_once_then_memory_mapped(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("NN_PLAYGROUND_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return np.arange(6, dtype=np.float32).reshape(3, 2), np.array([0, 1, 0])
+
+    X, y = cached_source_arrays("toy", fetch)
+    X_again, y_again = cached_source_arrays("toy", fetch)
+
+    assert len(calls) == 1
+    assert isinstance(X_again, np.memmap)
+    assert not X_again.flags.writeable
+    np.testing.assert_array_equal(X, X_again)
+    np.testing.assert_array_equal(y, y_again)
+
+
+def test_stratified_split_keeps_class_proportions() -> None:
+    ds = get_dataset("iris")
+    y = np.repeat(np.arange(3), [50, 30, 1])
+    X = np.arange(len(y), dtype=np.float32).reshape(-1, 1)
+
+    X_train, X_test, y_train, y_test = ds._stratified_split(X, y, 0.2)
+
+    assert np.bincount(y_test, minlength=3).tolist() == [10, 6, 0]
+    assert np.bincount(y_train, minlength=3).tolist() == [40, 24, 1]
+    # Every sample lands in exactly one split, with its label kept alongside
+    assert sorted(np.concatenate([X_train, X_test]).ravel()) == list(range(len(y)))
+    np.testing.assert_array_equal(y[X_train.ravel().astype(int)], y_train)
+
+
+def test_api_startup_does_not_import_sklearn_datasets(tmp_path) -> None:
+    # Fresh interpreter: this test process has already imported every dataset
+    script = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from backend.api.main import app\n"
+        "with TestClient(app):\n"
+        "    pass\n"
+        "print('sklearn' in sys.modules)\n"
+    )
+    src = Path(__file__).resolve().parents[2] / "src"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(src), "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
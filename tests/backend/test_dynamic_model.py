@@ -50,17 +50,14 @@ class TestClassificationModel:
         assert logits2.shape == (32, cfg["output_dim"])
         assert loss.dim() == 0  # scalar tensor
 
-    def test_hidden_softmax_allowed(self) -> None:
+    def test_hidden_softmax_rejected(self) -> None:
         cfg = _build_basic_mnist_config()
         # Insert Softmax on a hidden layer
         cfg["layers"].insert(
             2, {"type": "hidden", "neurons": 64, "activation": "Softmax"}
         )
-        model = DynamicMLPModel(cfg)
-
-        x = torch.randn(8, cfg["input_dim"])
-        logits = model(x)
-        assert logits.shape == (8, cfg["output_dim"])
+        with pytest.raises(ModelConfigError, match="output layer"):
+            DynamicMLPModel(cfg)
 
 
 class TestRegressionModel:
@@ -47,7 +47,7 @@ def test_create_model_returns_uuid_and_metadata() -> None:
     response = client.post("/api/models", json=build_payload())
     assert response.status_code == 201
     data = response.json()
-    assert re.fullmatch(r"[0-9a-f-]{36}", data["id"])
+    assert re.fullmatch(r"[0-9a-f]{32}", data["id"])
     assert data["name"] == "MNIST Builder"
     assert data["dataset_id"] == "mnist"
     assert data["status"] == "created"
@@ -93,3 +93,46 @@ def test_multiple_creations_return_unique_ids() -> None:
 
     assert first.status_code == second.status_code == 201
     assert first.json()["id"] != second.json()["id"]
+
+
+def test_input_layer_activation_rejected_by_schema() -> None:
+    payload = build_payload()
+    payload["layers"][0]["activation"] = "relu"  # type: ignore[index]
+    response = client.post("/api/models", json=payload)
+    assert response.status_code == 422
+
+
+def test_hidden_layer_softmax_rejected_by_schema() -> None:
+    payload = build_payload()
+    payload["layers"][1]["activation"] = "softmax"  # type: ignore[index]
+    response = client.post("/api/models", json=payload)
+    assert response.status_code == 422
+
+
+def test_layer_type_and_activation_are_case_insensitive() -> None:
+    payload = build_payload()
+    payload["layers"][1].update({"type": "Hidden", "activation": "ReLU"})  # type: ignore[index]
+    response = client.post("/api/models", json=payload)
+    assert response.status_code == 201
+    assert response.json()["layers"][1] == {
+        "type": "hidden",
+        "neurons": 128,
+        "activation": "relu",
+        "position": 1,
+    }
+
+
+def test_registry_cache_is_invalidated_when_store_is_cleared() -> None:
+    from backend.api.routes.training import ModelNotFoundError, _model_registry
+
+    model_id = client.post("/api/models", json=build_payload()).json()["id"]
+    db = SessionLocal()
+    try:
+        first = _model_registry.get(model_id, db)
+        assert _model_registry.get(model_id, db) is first
+
+        models_module.clear_model_store(db)
+        with pytest.raises(ModelNotFoundError):
+            _model_registry.get(model_id, db)
+    finally:
+        db.close()
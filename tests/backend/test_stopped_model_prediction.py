@@ -177,3 +177,30 @@ def test_running_model_cannot_be_used_for_prediction(
     )
     assert prediction_resp.status_code == 400
     assert "not complete" in prediction_resp.json()["detail"].lower()
+
+
+@pytest.mark.parametrize("inputs", [[], ["not", "numbers"], [[1.0, 2.0]]])
+def test_prediction_rejects_non_numeric_inputs(inputs: list) -> None:
+    """Malformed prediction inputs fail validation before reaching the engine."""
+    prediction_resp = client.post(
+        "/api/training/any-session/predict", json={"inputs": inputs}
+    )
+    assert prediction_resp.status_code == 422
+
+
+def test_batch_prediction_rejects_ragged_inputs() -> None:
+    """Batch rows must all have the same number of features."""
+    prediction_resp = client.post(
+        "/api/training/any-session/predict/batch",
+        json={"inputs": [[1.0, 2.0], [3.0]]},
+    )
+    assert prediction_resp.status_code == 422
+
+
+def test_batch_prediction_rejects_empty_rows() -> None:
+    """An empty row has no features to predict from."""
+    prediction_resp = client.post(
+        "/api/training/any-session/predict/batch",
+        json={"inputs": [[]]},
+    )
+    assert prediction_resp.status_code == 422
@@ -9,8 +9,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend.api.main import app
+from backend.api.routes.training import _session_manager
 from backend.database import SessionLocal
-from backend.db_models import ModelConfigDB
+from backend.db_models import ModelConfigDB, TrainingMetricsDB, TrainingSessionDB
 from backend.training.engine import TrainingEngine
 from backend.training.models import TrainingMetric, TrainingSession
 
@@ -111,6 +112,24 @@ def test_start_rejects_unknown_model() -> None:
     assert response.status_code == 404
 
 
+def test_start_rejects_unknown_dataset() -> None:
+    response = client.post(
+        "/api/models/test_model/train", json={"dataset_id": "not-a-dataset"}
+    )
+    assert response.status_code == 404
+    assert "not-a-dataset" in response.json()["detail"]
+
+
+def test_start_rejects_hidden_softmax() -> None:
+    layers = [
+        {"type": "input", "neurons": 4, "position": 0},
+        {"type": "hidden", "neurons": 8, "activation": "Softmax", "position": 1},
+        {"type": "output", "neurons": 3, "activation": "softmax", "position": 2},
+    ]
+    response = client.post("/api/models/test_model/train", json={"layers": layers})
+    assert response.status_code == 422
+
+
 def test_duplicate_start_returns_400(monkeypatch: pytest.MonkeyPatch) -> None:
     blocker = threading.Event()
 
@@ -141,6 +160,264 @@ def test_duplicate_start_returns_400(monkeypatch: pytest.MonkeyPatch) -> None:
     time.sleep(0.05)
 
 
+def test_start_returns_429_when_all_workers_are_busy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        _session_manager, "_training_slots", threading.BoundedSemaphore(1)
+    )
+    _session_manager._training_slots.acquire()
+
+    response = client.post("/api/models/test_model/train", json={})
+    assert response.status_code == 429
+
+
+def test_finished_jobs_are_evicted_beyond_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_train(
+        self: TrainingEngine, model_id: str | None = None
+    ) -> TrainingSession:
+        session = _build_fake_session(model_id or "unknown", self.dataset_id)
+        self.session = session
+        _emit_metrics(session, 2)
+        session.status = "completed"
+        session.end_time = datetime.now(timezone.utc)
+        return session
+
+    def wait_until(condition) -> None:
+        deadline = time.monotonic() + 5.0
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert condition()
+
+    monkeypatch.setattr(TrainingEngine, "train", fake_train, raising=False)
+    monkeypatch.setattr(_session_manager, "_max_finished_jobs", 1)
+
+    first = client.post("/api/models/test_model/train", json={}).json()["session_id"]
+    wait_until(lambda: first in _session_manager._finished_jobs)
+    second = client.post("/api/models/test_model/train", json={}).json()["session_id"]
+    wait_until(lambda: first not in _session_manager._jobs)
+
+    assert second in _session_manager._jobs
+    # History survives eviction; only the in-memory model is gone
+    stored = client.get(f"/api/training/{first}/status").json()
+    assert stored["status"] == "completed"
+    assert [m["epoch"] for m in stored["metrics"]] == [1, 2]
+    predict = client.post(f"/api/training/{first}/predict", json={"inputs": [1.0]})
+    assert predict.status_code == 404
+
+
+def test_status_of_stored_session_returns_only_unseen_metrics() -> None:
+    session_id = str(uuid4())
+    db = SessionLocal()
+    try:
+        db.add(
+            TrainingSessionDB(
+                session_id=session_id,
+                model_id="test_model",
+                dataset_id="iris",
+                status="completed",
+                total_epochs=3,
+                current_epoch=3,
+            )
+        )
+        for epoch in (1, 2, 3):
+            db.add(TrainingMetricsDB(session_id=session_id, epoch=epoch, loss=0.5))
+        db.commit()
+    finally:
+        db.close()
+
+    resp = client.get(f"/api/training/{session_id}/status", params={"since_epoch": 1})
+    assert resp.status_code == 200
+    assert [m["epoch"] for m in resp.json()["metrics"]] == [2, 3]
+
+
+def test_status_returns_304_when_nothing_changed() -> None:
+    session_id = str(uuid4())
+    db = SessionLocal()
+    try:
+        db.add(
+            TrainingSessionDB(
+                session_id=session_id,
+                model_id="test_model",
+                dataset_id="iris",
+                status="completed",
+                total_epochs=1,
+                current_epoch=1,
+            )
+        )
+        db.add(TrainingMetricsDB(session_id=session_id, epoch=1, loss=0.5))
+        db.commit()
+    finally:
+        db.close()
+
+    first = client.get(f"/api/training/{session_id}/status")
+    etag = first.headers["etag"]
+
+    cached = client.get(
+        f"/api/training/{session_id}/status", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    filtered = client.get(
+        f"/api/training/{session_id}/status",
+        params={"since_epoch": 1},
+        headers={"If-None-Match": etag},
+    )
+    assert filtered.status_code == 200
+    assert filtered.json()["metrics"] == []
+
+
+def test_status_etag_changes_when_session_finishes() -> None:
+    session_id = str(uuid4())
+    db = SessionLocal()
+    try:
+        db.add(
+            TrainingSessionDB(
+                session_id=session_id,
+                model_id="test_model",
+                dataset_id="iris",
+                status="stopped",
+                total_epochs=3,
+                current_epoch=1,
+            )
+        )
+        db.add(TrainingMetricsDB(session_id=session_id, epoch=1, loss=0.5))
+        db.commit()
+
+        etag = client.get(f"/api/training/{session_id}/status").headers["etag"]
+
+        # Same status, epoch and metrics; only the completion fields arrive later
+        row = db.get(TrainingSessionDB, session_id)
+        row.end_time = datetime.now(timezone.utc)
+        row.error_message = "Training stopped by user"
+        db.commit()
+    finally:
+        db.close()
+
+    resp = client.get(
+        f"/api/training/{session_id}/status", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["error_message"] == "Training stopped by user"
+    assert resp.json()["completed_at"] is not None
+
+
 def test_status_unknown_session() -> None:
     resp = client.get("/api/training/not-real/status")
     assert resp.status_code == 404
+
+
+def test_status_long_poll_returns_when_training_finishes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    blocker = threading.Event()
+
+    def blocking_train(
+        self: TrainingEngine, model_id: str | None = None
+    ) -> TrainingSession:
+        session = _build_fake_session(
+            model_id or "unknown", self.dataset_id, total_epochs=2
+        )
+        self.session = session
+        blocker.wait(timeout=5.0)
+        _emit_metrics(session, 2)
+        session.status = "completed"
+        session.end_time = datetime.now(timezone.utc)
+        return session
+
+    monkeypatch.setattr(TrainingEngine, "train", blocking_train, raising=False)
+
+    response = client.post("/api/models/test_model/train", json={})
+    assert response.status_code == 202
+    session_id = response.json()["session_id"]
+
+    threading.Timer(0.2, blocker.set).start()
+    started = time.monotonic()
+    status_resp = client.get(
+        f"/api/training/{session_id}/status",
+        params={"wait": 10, "since_status": "running"},
+    )
+    assert status_resp.status_code == 200
+    payload = status_resp.json()
+    assert payload["status"] == "completed"
+    assert len(payload["metrics"]) == 2
+    assert time.monotonic() - started < 5.0
+
+
+def test_stream_emits_metric_and_status_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_train(
+        self: TrainingEngine, model_id: str | None = None
+    ) -> TrainingSession:
+        session = _build_fake_session(
+            model_id or "unknown", self.dataset_id, total_epochs=3
+        )
+        self.session = session
+        _emit_metrics(session, 3)
+        session.status = "completed"
+        session.end_time = datetime.now(timezone.utc)
+        return session
+
+    monkeypatch.setattr(TrainingEngine, "train", fake_train, raising=False)
+
+    response = client.post("/api/models/test_model/train", json={})
+    assert response.status_code == 202
+    session_id = response.json()["session_id"]
+    client.get(
+        f"/api/training/{session_id}/status",
+        params={"wait": 5, "since_status": "running"},
+    )
+
+    stream_resp = client.get(f"/api/training/{session_id}/stream")
+    assert stream_resp.status_code == 200
+    assert stream_resp.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        block.split("\n")
+        for block in stream_resp.text.strip().split("\n\n")
+        if block.startswith("event:")
+    ]
+    names = [lines[0].split(": ", 1)[1] for lines in events]
+    assert names == ["metric", "metric", "metric", "status"]
+    assert '"status": "completed"' in events[-1][1]
+
+
+def test_stream_of_stored_running_session_ends() -> None:
+    # A row left "running" by a restart has no live job to report progress
+    session_id = str(uuid4())
+    db = SessionLocal()
+    try:
+        db.add(
+            TrainingSessionDB(
+                session_id=session_id,
+                model_id="test_model",
+                dataset_id="iris",
+                status="running",
+                total_epochs=3,
+                current_epoch=1,
+            )
+        )
+        db.add(TrainingMetricsDB(session_id=session_id, epoch=1, loss=0.5))
+        db.commit()
+    finally:
+        db.close()
+
+    started = time.monotonic()
+    stream_resp = client.get(f"/api/training/{session_id}/stream")
+    assert stream_resp.status_code == 200
+    assert time.monotonic() - started < 5.0
+    names = [
+        block.split("\n")[0].split(": ", 1)[1]
+        for block in stream_resp.text.strip().split("\n\n")
+        if block.startswith("event:")
+    ]
+    assert names == ["metric", "status"]
+
+
+def test_stream_unknown_session() -> None:
+    resp = client.get("/api/training/not-real/stream")
+    assert resp.status_code == 404
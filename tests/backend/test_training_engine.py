@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pytest
+import torch
 
 from backend.datasets.base import Hyperparameters
 from backend.models.dynamic_model import DynamicMLPModel
@@ -111,6 +112,68 @@ def test_diverged_loss_does_not_stop_training(mock_get_dataset, simple_model_con
     assert session.metrics[-1].loss == pytest.approx(1e7)
 
 
+@patch("backend.training.engine.get_dataset")
+def test_predict_batch_matches_single_predictions(
+    mock_get_dataset, simple_model_config
+):
+    mock_dataset = MockDataset(task_type="classification", features=10, samples=50)
+    mock_get_dataset.return_value = mock_dataset
+    engine = TrainingEngine(dataset_id="mock_batch", model_config=simple_model_config)
+    engine.train()
+
+    batch = engine.predict_batch(mock_dataset.X[:5])
+    assert len(batch["predictions"]) == 5
+    assert len(batch["probabilities"]) == 5
+    for row, prediction in zip(mock_dataset.X[:5], batch["predictions"]):
+        single = engine.predict(row)
+        assert single["prediction"] == prediction
+
+
+def test_iter_batches_covers_every_sample_once():
+    X = torch.arange(23, dtype=torch.float32).unsqueeze(1)
+    y = torch.arange(23)
+
+    batches = list(TrainingEngine._iter_batches(X, y, batch_size=5))
+    assert [len(yb) for _, yb in batches] == [5, 5, 5, 5, 3]
+    seen = torch.cat([yb for _, yb in batches])
+    assert sorted(seen.tolist()) == list(range(23))
+    for Xb, yb in batches:
+        assert torch.equal(Xb.squeeze(1).long(), yb)
+
+
+def test_bf16_epoch_reports_float32_loss(simple_model_config):
+    torch.manual_seed(0)
+    config = {
+        "input_dim": 10,
+        "output_dim": 2,
+        "task_type": "classification",
+        "layers": simple_model_config["layers"],
+    }
+    model = DynamicMLPModel(config)
+    X = torch.randn(64, 10)
+    y = (X[:, 0] > 0).long()
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.01)
+    engine = TrainingEngine(dataset_id="mock_bf16", model_config=simple_model_config)
+
+    losses = [
+        engine._train_one_epoch(
+            X,
+            y,
+            16,
+            model,
+            optimizer,
+            torch.nn.CrossEntropyLoss(),
+            "classification",
+            use_bf16=True,
+        )[0]
+        for _ in range(20)
+    ]
+    assert all(np.isfinite(losses))
+    assert losses[-1] < losses[0]
+    # Weights stay float32; only the forward pass is autocast
+    assert all(p.dtype == torch.float32 for p in model.parameters())
+
+
 def test_dynamic_model_creation(simple_model_config):
     # Use teammate's model builder format
     config = {